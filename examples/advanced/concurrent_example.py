@@ -6,89 +6,127 @@ Advanced example: Concurrent requests with async Jupiter SDK
 import asyncio
 import logging
 import time
-from typing import Any
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
 
 from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient
+from pyjupiter.utils.eventloop import run
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-async def check_token_safety(client: AsyncUltraApiClient, mint: str) -> dict[str, Any]:
-    """Check a single token for safety warnings"""
+T = TypeVar("T")
+
+# Upper bound on in-flight requests to the Jupiter host
+MAX_CONCURRENT_REQUESTS = 64
+
+# Popular Solana tokens, as parallel tuples of mint addresses and names
+TOKEN_MINTS = (
+    "So11111111111111111111111111111111111111112",
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",
+    "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
+    "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+    "HZ1JovNiVvGrGNiiYvEozEVgZ58xaU3RKwX8eACQBCt3",
+    "jtojtomepa8beP8AuQc6eXt5FriJwfFMwQx2v2f9mCL",
+)
+TOKEN_NAMES = ("WSOL", "USDC", "USDT", "ETH", "BONK", "PYTH", "JTO")
+
+
+@dataclass
+class BalanceResult:
+    """Outcome of a single balances lookup; error is None on success"""
+
+    __slots__ = ("address", "balance", "error", "short_address")
+
+    address: str
+    short_address: str
+    balance: Optional[dict[str, Any]]
+    error: Optional[str]
+
+
+class TokenBucket:
+    """Async token bucket: allows bursts up to capacity, then refills at rate tokens per second"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping only as long as needed for one to become available"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._updated = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1
+
+
+async def run_all(coros: list[Coroutine[Any, Any, T]]) -> list[T]:
+    """Run coroutines concurrently, cancelling the rest as soon as one fails"""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
     try:
-        response = await client.shield(mints=[mint])
-        return {
-            "mint": mint,
-            "warnings": response.get("warnings", {}).get(mint, []),
-            "success": True,
-        }
-    except Exception as e:
-        return {"mint": mint, "error": str(e), "success": False}
-
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancelled tasks to wind down and collect their outcomes, so
+        # no exception raised along the way is left unretrieved
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
-async def concurrent_token_check():
-    """Check multiple tokens concurrently"""
 
-    # Popular Solana tokens
-    tokens = {
-        "So11111111111111111111111111111111111111112": "WSOL",
-        "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": "USDC",
-        "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": "USDT",
-        "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs": "ETH",
-        "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263": "BONK",
-        "HZ1JovNiVvGrGNiiYvEozEVgZ58xaU3RKwX8eACQBCt3": "PYTH",
-        "jtojtomepa8beP8AuQc6eXt5FriJwfFMwQx2v2f9mCL": "JTO",
-    }
+async def concurrent_token_check(client: AsyncUltraApiClient):
+    """Check multiple tokens with one batched shield request"""
 
-    logger.info(f"Checking {len(tokens)} tokens concurrently...")
+    logger.info(f"Checking {len(TOKEN_MINTS)} tokens in a single shield request...")
 
-    client = AsyncUltraApiClient()
     start_time = time.time()
 
+    # The shield endpoint accepts many mints at once, so one request covers them all
     try:
-        # Create tasks for all tokens
-        tasks = [check_token_safety(client, mint) for mint in tokens]
-
-        # Execute all requests concurrently
-        results = await asyncio.gather(*tasks)
-
-        # Process results
-        logger.info("=== Token Safety Check Results ===")
-
-        safe_tokens = []
-        warning_tokens = []
-
-        for result in results:
-            if result["success"]:
-                token_name = tokens.get(result["mint"], "Unknown")
-
-                if result["warnings"]:
-                    warning_tokens.append((token_name, result))
-                    logger.warning(f"⚠️  {token_name} ({result['mint'][:8]}...)")
-                    for warning in result["warnings"]:
-                        logger.warning(f"   - {warning.get('type')}: {warning.get('message')}")
-                else:
-                    safe_tokens.append(token_name)
-                    logger.info(f"✅ {token_name} ({result['mint'][:8]}...) - No warnings")
-            else:
-                logger.error(f"❌ Failed to check {result['mint']}: {result.get('error')}")
-
-        # Summary
-        elapsed = time.time() - start_time
-        logger.info("=== Summary ===")
-        logger.info(f"Total tokens checked: {len(tokens)}")
-        logger.info(f"Safe tokens: {len(safe_tokens)}")
-        logger.info(f"Tokens with warnings: {len(warning_tokens)}")
-        logger.info(f"Time elapsed: {elapsed:.2f} seconds")
-        logger.info(f"Average time per request: {elapsed / len(tokens):.3f} seconds")
-
-    finally:
-        await client.close()
-
-
-async def batch_balance_check():
+        response = await client.shield(mints=TOKEN_MINTS)
+    except Exception as e:
+        logger.error(f"❌ Failed to check tokens: {e}")
+        return
+
+    all_warnings = response.get("warnings", {})
+
+    logger.info("=== Token Safety Check Results ===")
+
+    safe_tokens = []
+    warning_tokens = []
+
+    for mint, token_name in zip(TOKEN_MINTS, TOKEN_NAMES):
+        short_mint = mint[:8]
+        warnings = all_warnings.get(mint, [])
+        if warnings:
+            warning_tokens.append((token_name, warnings))
+            lines = [f"⚠️  {token_name} ({short_mint}...)"]
+            lines.extend(f"   - {warning.get('type')}: {warning.get('message')}" for warning in warnings)
+            logger.warning("\n".join(lines))
+        else:
+            safe_tokens.append(token_name)
+            logger.info(f"✅ {token_name} ({short_mint}...) - No warnings")
+
+    # Summary
+    elapsed = time.time() - start_time
+    logger.info("=== Summary ===")
+    logger.info(f"Total tokens checked: {len(TOKEN_MINTS)}")
+    logger.info(f"Safe tokens: {len(safe_tokens)}")
+    logger.info(f"Tokens with warnings: {len(warning_tokens)}")
+    logger.info(f"Time elapsed: {elapsed:.2f} seconds")
+
+
+async def batch_balance_check(client: AsyncUltraApiClient):
     """Check balances for multiple addresses concurrently"""
 
     # Example addresses (you can replace with real ones)
@@ -100,46 +138,33 @@ async def batch_balance_check():
 
     logger.info(f"Checking balances for {len(addresses)} addresses...")
 
-    client = AsyncUltraApiClient()
-
-    async def get_balance(address: str):
-        try:
-            balance = await client.balances(address)
-            return {"address": address, "balance": balance, "success": True}
-        except Exception as e:
-            return {"address": address, "error": str(e), "success": False}
-
-    try:
-        # Check all balances concurrently
-        tasks = [get_balance(addr) for addr in addresses]
-        results = await asyncio.gather(*tasks)
-
-        # Display results
-        for result in results:
-            success = result.get("success", False)
-            if success is True:
-                address = str(result.get("address", ""))
-                if len(address) >= 16:
-                    logger.info(f"Address: {address[:16]}...")
-                else:
-                    logger.info(f"Address: {address}...")
-                balance = result.get("balance")
-                if balance and isinstance(balance, dict):
-                    for token, details in balance.items():
-                        if isinstance(details, dict):
-                            logger.info(f"  {token}: {details.get('uiAmount', 0)}")
-                else:
-                    logger.info("  No balances found")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def get_balance(address: str, short_address: str) -> BalanceResult:
+        async with semaphore:
+            try:
+                balance = await client.balances(address)
+                return BalanceResult(address, short_address, balance, None)
+            except Exception as e:
+                return BalanceResult(address, short_address, None, str(e))
+
+    # Check all balances concurrently, displaying each result as it arrives
+    tasks = [get_balance(addr, addr[:16]) for addr in addresses]
+    for next_result in asyncio.as_completed(tasks):
+        result = await next_result
+        if result.error is None:
+            logger.info(f"Address: {result.short_address}...")
+            if result.balance:
+                for token, details in result.balance.items():
+                    if isinstance(details, dict):
+                        logger.info(f"  {token}: {details.get('uiAmount', 0)}")
             else:
-                address = str(result.get("address", "Unknown"))
-                error = str(result.get("error", "Unknown error"))
-                logger.error(f"Failed to check {address}: {error}")
-
-    finally:
-        await client.close()
+                logger.info("  No balances found")
+        else:
+            logger.error(f"Failed to check {result.address}: {result.error}")
 
 
-async def rate_limited_requests():
+async def rate_limited_requests(client: AsyncUltraApiClient):
     """Example of rate-limited concurrent requests"""
 
     logger.info("=== Rate-Limited Concurrent Requests ===")
@@ -148,39 +173,54 @@ async def rate_limited_requests():
     max_concurrent = 3
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def rate_limited_request(client: AsyncUltraApiClient, mint: str, delay: float):
-        async with semaphore:  # Acquire semaphore
-            logger.info(f"🔄 Checking {mint[:8]}...")
-            await asyncio.sleep(delay)  # Simulate some processing
-            result = await client.shield(mints=[mint])
-            logger.info(f"✓ Completed {mint[:8]}...")
-            return result
+    # Requests per second allowed once the initial burst is spent
+    requests_per_second = 2.0
+    bucket = TokenBucket(rate=requests_per_second, capacity=max_concurrent)
+
+    # Mints per shield request; each request checks a whole batch
+    batch_size = 2
 
-    client = AsyncUltraApiClient()
+    async def rate_limited_request(client: AsyncUltraApiClient, batch: list[str]):
+        async with semaphore:  # The semaphore caps open connections, the bucket caps request rate
+            label = ", ".join(mint[:8] for mint in batch)
+            logger.info(f"🔄 Checking {label}...")
+            await bucket.acquire()
+            result = await client.shield(mints=batch)
+            logger.info(f"✓ Completed {label}...")
+            return result
 
+    # Tokens not in TOKEN_MINTS, so the shield cache filled by the first example
+    # does not answer them and every batch is a real HTTP request
     mints = [
-        "So11111111111111111111111111111111111111112",
-        "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-        "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",
-        "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
-        "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+        "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN",  # JUP
+        "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R",  # RAY
+        "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",  # mSOL
+        "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm",  # WIF
+        "J1toso1uCk3RLmjorhTtrVwY9HJ7X8V9yYac6Y7kGCPn",  # JitoSOL
     ]
+    batches = [mints[i : i + batch_size] for i in range(0, len(mints), batch_size)]
 
-    try:
-        msg = f"Processing {len(mints)} requests with max {max_concurrent} concurrent..."
-        logger.info(msg)
+    msg = (
+        f"Processing {len(mints)} mints in {len(batches)} requests "
+        f"with max {max_concurrent} concurrent at {requests_per_second:g} requests/s..."
+    )
+    logger.info(msg)
 
-        tasks = [rate_limited_request(client, mint, 0.5) for mint in mints]
+    tasks = [rate_limited_request(client, batch) for batch in batches]
 
-        start = time.time()
-        await asyncio.gather(*tasks)
-        elapsed = time.time() - start
+    start = time.time()
+    responses = await run_all(tasks)
+    elapsed = time.time() - start
 
-        logger.info(f"Completed in {elapsed:.2f} seconds")
-        logger.info(f"(Would take {len(mints) * 0.5:.2f} seconds sequentially)")
+    # Each response already covers a whole batch, so read the warnings in a plain loop
+    flagged_mints = []
+    for response in responses:
+        for mint, warnings in response.get("warnings", {}).items():
+            if warnings:
+                flagged_mints.append(mint)
 
-    finally:
-        await client.close()
+    logger.info(f"Mints with warnings: {len(flagged_mints)}")
+    logger.info(f"Completed in {elapsed:.2f} seconds")
 
 
 async def main():
@@ -188,15 +228,19 @@ async def main():
 
     logger.info("=== Jupiter SDK Concurrent Operations Demo ===")
 
-    # Example 1: Concurrent token safety checks
-    await concurrent_token_check()
+    # Share one client (and its connection pool) across all examples.
+    # Shield results rarely change, so cache them to skip repeat lookups.
+    async with AsyncUltraApiClient(shield_cache_ttl=3600) as client:
+        # Example 1: Concurrent token safety checks
+        await concurrent_token_check(client)
 
-    # Example 2: Batch balance checks
-    # await batch_balance_check()
+        # Example 2: Batch balance checks
+        # await batch_balance_check(client)
 
-    # Example 3: Rate-limited requests
-    await rate_limited_requests()
+        # Example 3: Rate-limited requests
+        await rate_limited_requests(client)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Runs on uvloop when installed (pyjupiter[fast]), otherwise on the default asyncio loop
+    run(main())
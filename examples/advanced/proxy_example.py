@@ -18,6 +18,7 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from curl_cffi import CurlHttpVersion
 from utils import load_environment
 
 from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient
@@ -40,30 +41,26 @@ async def example_with_proxy():
     proxies = {"https": "socks5://127.0.0.1:1080"}
 
     logger.info("Creating client with SOCKS5 proxy...")
-    client = AsyncUltraApiClient(
+    async with AsyncUltraApiClient(
         client_kwargs={
             "proxies": proxies,
             "timeout": 30,  # 30 seconds timeout
             "verify": True,  # Verify SSL certificates even through proxy
         }
-    )
-
-    try:
-        # Test the connection
-        logger.info("Fetching shield information through proxy...")
-
-        wsol_mint = "So11111111111111111111111111111111111111112"
-        shield_response = await client.shield(mints=[wsol_mint])
+    ) as client:
+        try:
+            # Test the connection
+            logger.info("Fetching shield information through proxy...")
 
-        logger.info("✓ Successfully connected through proxy!")
-        logger.info(f"Response type: {type(shield_response)}")
+            wsol_mint = "So11111111111111111111111111111111111111112"
+            shield_response = await client.shield(mints=[wsol_mint])
 
-    except Exception as e:
-        logger.error(f"✗ Error occurred: {e}")
-        logger.error("Make sure your proxy is running and accessible")
+            logger.info("✓ Successfully connected through proxy!")
+            logger.info(f"Response type: {type(shield_response)}")
 
-    finally:
-        await client.close()
+        except Exception as e:
+            logger.error(f"✗ Error occurred: {e}")
+            logger.error("Make sure your proxy is running and accessible")
 
 
 async def example_with_basic_client():
@@ -76,37 +73,37 @@ async def example_with_basic_client():
     # - timeout: Connection timeout
     # - verify: SSL certificate verification
     # - trust_env: Use environment proxy settings
-    # - impersonate: Browser fingerprinting
-    client = AsyncUltraApiClient(
+    # - impersonate: Browser fingerprinting (defaults to "chrome120")
+    # - http_version: HTTP protocol version (defaults to HTTP/2 so concurrent
+    #   requests share one connection)
+    # - max_clients: Maximum concurrent transfers (defaults to 64)
+    async with AsyncUltraApiClient(
         client_kwargs={
             "timeout": 30,  # 30 seconds timeout
             "verify": True,  # Verify SSL certificates
             "trust_env": True,  # Use environment proxy settings
+            "http_version": CurlHttpVersion.V2_0,  # Multiplex requests over HTTP/2
         }
-    )
-
-    try:
-        logger.info("Testing basic client connection...")
-
-        # Test with shield endpoint (doesn't require private key)
-        wsol_mint = "So11111111111111111111111111111111111111112"
-        shield_response = await client.shield(mints=[wsol_mint])
-        logger.info("✓ Shield endpoint working correctly!")
-        logger.info(f"Shield response type: {type(shield_response)}")
-
-        # Only test public key if PRIVATE_KEY is available
+    ) as client:
         try:
-            public_key = await client.get_public_key()
-            logger.info(f"✓ Public key retrieved: {public_key}")
-        except ValueError as pk_error:
-            logger.info(f"Info: Private key not available: {pk_error}")
-            logger.info("Set PRIVATE_KEY environment variable to test key functionality")
+            logger.info("Testing basic client connection...")
+
+            # Test with shield endpoint (doesn't require private key)
+            wsol_mint = "So11111111111111111111111111111111111111112"
+            shield_response = await client.shield(mints=[wsol_mint])
+            logger.info("✓ Shield endpoint working correctly!")
+            logger.info(f"Shield response type: {type(shield_response)}")
 
-    except Exception as e:
-        logger.error(f"✗ Error occurred: {e}")
+            # Only test public key if PRIVATE_KEY is available
+            try:
+                public_key = await client.get_public_key()
+                logger.info(f"✓ Public key retrieved: {public_key}")
+            except ValueError as pk_error:
+                logger.info(f"Info: Private key not available: {pk_error}")
+                logger.info("Set PRIVATE_KEY environment variable to test key functionality")
 
-    finally:
-        await client.close()
+        except Exception as e:
+            logger.error(f"✗ Error occurred: {e}")
 
 
 async def example_with_http_proxy():
@@ -120,31 +117,27 @@ async def example_with_http_proxy():
     }
 
     logger.info("Creating client with HTTP proxy...")
-    client = AsyncUltraApiClient(
+    async with AsyncUltraApiClient(
         client_kwargs={
             "proxies": proxies,
             "verify": True,  # Verify SSL certificates
             "timeout": 30,  # 30 seconds timeout
             "trust_env": False,  # Don't use environment proxy settings
         }
-    )
-
-    try:
-        logger.info("Testing connection through HTTP proxy...")
-
-        # Test with a simple request
-        usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
-        shield_response = await client.shield(mints=[usdc_mint])
+    ) as client:
+        try:
+            logger.info("Testing connection through HTTP proxy...")
 
-        logger.info("✓ Successfully connected through HTTP proxy!")
-        logger.info(f"Response type: {type(shield_response)}")
+            # Test with a simple request
+            usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+            shield_response = await client.shield(mints=[usdc_mint])
 
-    except Exception as e:
-        logger.error(f"✗ Error occurred: {e}")
-        logger.error("Check your proxy settings and credentials")
+            logger.info("✓ Successfully connected through HTTP proxy!")
+            logger.info(f"Response type: {type(shield_response)}")
 
-    finally:
-        await client.close()
+        except Exception as e:
+            logger.error(f"✗ Error occurred: {e}")
+            logger.error("Check your proxy settings and credentials")
 
 
 async def main():
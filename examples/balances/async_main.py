@@ -17,25 +17,24 @@ logger = logging.getLogger(__name__)
 async def main():
     load_environment()
 
-    client = AsyncUltraApiClient()
-
-    address = await client.get_public_key()
-
-    try:
-        balances_response = await client.balances(str(address))
-
-        logger.info("Balances API Response (Async):")
-        for token, details in balances_response.items():
-            logger.info(f"Token: {token}")
-            logger.info(f"  - Amount: {details['amount']}")
-            logger.info(f"    UI Amount: {details['uiAmount']}")
-            logger.info(f"    Slot: {details['slot']}")
-            logger.info(f"    Is Frozen: {details['isFrozen']}")
-
-    except Exception as e:
-        logger.error("Error occurred while fetching balances:", str(e))
-    finally:
-        await client.close()
+    async with AsyncUltraApiClient() as client:
+        address = await client.get_public_key()
+
+        try:
+            balances_response = await client.balances(str(address))
+
+            rows = [
+                f"Token: {token}\n"
+                f"  - Amount: {details['amount']}\n"
+                f"    UI Amount: {details['uiAmount']}\n"
+                f"    Slot: {details['slot']}\n"
+                f"    Is Frozen: {details['isFrozen']}"
+                for token, details in balances_response.items()
+            ]
+            logger.info("Balances API Response (Async):\n" + "\n".join(rows))
+
+        except Exception as e:
+            logger.error("Error occurred while fetching balances:", str(e))
 
 
 if __name__ == "__main__":
@@ -13,22 +13,21 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 load_environment()
-client = UltraApiClient()
-
-address = client.get_public_key()
-
-try:
-    balances_response = client.balances(str(address))
-
-    logger.info("Balances API Response:")
-    for token, details in balances_response.items():
-        logger.info(f"Token: {token}")
-        logger.info(f"  - Amount: {details['amount']}")
-        logger.info(f"    UI Amount: {details['uiAmount']}")
-        logger.info(f"    Slot: {details['slot']}")
-        logger.info(f"    Is Frozen: {details['isFrozen']}")
-
-except Exception as e:
-    logger.error("Error occurred while fetching balances:", str(e))
-finally:
-    client.close()
+with UltraApiClient() as client:
+    address = client.get_public_key()
+
+    try:
+        balances_response = client.balances(str(address))
+
+        rows = [
+            f"Token: {token}\n"
+            f"  - Amount: {details['amount']}\n"
+            f"    UI Amount: {details['uiAmount']}\n"
+            f"    Slot: {details['slot']}\n"
+            f"    Is Frozen: {details['isFrozen']}"
+            for token, details in balances_response.items()
+        ]
+        logger.info("Balances API Response:\n" + "\n".join(rows))
+
+    except Exception as e:
+        logger.error("Error occurred while fetching balances:", str(e))
@@ -1,18 +1,26 @@
 """Utility functions for examples."""
 
+import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+# The .env file lives in the project root, one level above the examples directory
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+# Set once the environment has been loaded, so later calls can skip parsing
+ENV_LOADED_FLAG = "PYJUPITER_ENV_LOADED"
+
 
 def load_environment() -> None:
     """Load environment variables from .env file."""
-    # Find .env file starting from examples directory going up
-    current_dir = Path(__file__).parent
-    env_path = current_dir.parent / ".env"
+    if os.environ.get(ENV_LOADED_FLAG):
+        return
 
-    if env_path.exists():
-        load_dotenv(env_path)
+    if ENV_PATH.exists():
+        load_dotenv(ENV_PATH)
     else:
         # Fallback to load from current environment
         load_dotenv()
+
+    os.environ[ENV_LOADED_FLAG] = "1"
@@ -5,9 +5,8 @@ This package provides both synchronous and asynchronous clients for interacting
 with Jupiter's swap and trading APIs, including the Ultra API for advanced trading features.
 """
 
-# Import client classes
-from pyjupiter.clients.jupiter_client import AsyncJupiterClient, JupiterClient
-from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # Import exception classes
 from pyjupiter.exceptions import (
@@ -19,9 +18,22 @@ from pyjupiter.exceptions import (
     JupiterValidationError,
 )
 
-# Import model classes
-from pyjupiter.models.ultra_api.ultra_execute_request_model import UltraExecuteRequest
-from pyjupiter.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+if TYPE_CHECKING:
+    from pyjupiter.clients.jupiter_client import AsyncJupiterClient, JupiterClient
+    from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+    from pyjupiter.models.ultra_api.ultra_execute_request_model import UltraExecuteRequest
+    from pyjupiter.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+
+# Client and model classes pull in curl_cffi, solders and pydantic, so they are
+# imported on first access instead of when the package is imported.
+_LAZY_IMPORTS = {
+    "AsyncJupiterClient": "pyjupiter.clients.jupiter_client",
+    "JupiterClient": "pyjupiter.clients.jupiter_client",
+    "AsyncUltraApiClient": "pyjupiter.clients.ultra_api_client",
+    "UltraApiClient": "pyjupiter.clients.ultra_api_client",
+    "UltraExecuteRequest": "pyjupiter.models.ultra_api.ultra_execute_request_model",
+    "UltraOrderRequest": "pyjupiter.models.ultra_api.ultra_order_request_model",
+}
 
 __version__ = "0.1.0"
 
@@ -42,3 +54,18 @@ __all__ = [
     "UltraExecuteRequest",
     "UltraOrderRequest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
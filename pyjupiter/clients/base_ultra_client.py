@@ -1,14 +1,104 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Mapping, Sequence
+from functools import lru_cache
 from typing import Any, Optional, Union
 
-from pyjupiter.exceptions import JupiterValidationError
+import orjson
+
+from pyjupiter.exceptions import (
+    JupiterAPIError,
+    JupiterAuthenticationError,
+    JupiterNetworkError,
+    JupiterRateLimitError,
+    JupiterValidationError,
+)
 from pyjupiter.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteParams,
     UltraExecuteRequest,
 )
 from pyjupiter.models.ultra_api.ultra_order_request_model import (
+    UltraOrderParams,
     UltraOrderRequest,
 )
+from pyjupiter.utils.cache import TTLCache
+
+# Marker for mints whose shield result is not cached (None means "no warnings")
+_NOT_CACHED = object()
+
+
+@lru_cache(maxsize=128)
+def _join_mints(mints: tuple[str, ...]) -> str:
+    """Join mint addresses into the comma-separated form used by the shield endpoint."""
+    return ",".join(mints)
+
+
+# Keys read from error responses
+_ERROR_MESSAGE_KEY = "errorMessage"
+_MESSAGE_KEY = "message"
+_RETRY_AFTER_HEADER = "retry-after"
+
+# Exception type and message for HTTP error statuses with a dedicated error
+_STATUS_ERRORS: dict[int, tuple[type[JupiterAPIError], str]] = {
+    401: (JupiterAuthenticationError, "Authentication failed: Invalid API key or unauthorized access"),
+    403: (JupiterAuthenticationError, "Access forbidden: Insufficient permissions"),
+}
+
+
+def _raise_for_status(response) -> None:
+    """
+    Raise the matching Jupiter exception if the response has an HTTP error status.
+
+    The status code is checked directly rather than through curl_cffi's
+    raise_for_status, so no intermediate exception is raised and caught.
+
+    Args:
+        response: The HTTP response object from curl_cffi.
+
+    Raises:
+        JupiterAuthenticationError: For 401/403 status codes.
+        JupiterRateLimitError: For 429 status code.
+        JupiterAPIError: For other HTTP error status codes.
+    """
+    status_code = response.status_code
+    if status_code < 400:
+        return
+
+    # Try to get response data for error details
+    try:
+        response_data = orjson.loads(response.content)
+    except Exception:
+        # If we can't parse the response, just use the status code
+        response_data = {}
+
+    if status_code == 429:
+        # Extract retry-after header if available
+        retry_after = None
+        retry_after_header = response.headers.get(_RETRY_AFTER_HEADER)
+        if retry_after_header:
+            try:
+                retry_after = int(retry_after_header)
+            except ValueError:
+                retry_after = None
+
+        raise JupiterRateLimitError(
+            "Rate limit exceeded. Please try again later.",
+            retry_after=retry_after,
+            status_code=status_code,
+            response_data=response_data,
+        )
+
+    status_error = _STATUS_ERRORS.get(status_code)
+    if status_error is not None:
+        error_cls, message = status_error
+        raise error_cls(message, status_code=status_code, response_data=response_data)
+
+    error_message = f"HTTP {status_code} error"
+    if response_data and _ERROR_MESSAGE_KEY in response_data:
+        error_message = response_data[_ERROR_MESSAGE_KEY]
+    elif response_data and _MESSAGE_KEY in response_data:
+        error_message = response_data[_MESSAGE_KEY]
+
+    raise JupiterAPIError(error_message, status_code=status_code, response_data=response_data)
 
 
 class BaseUltraClient(ABC):
@@ -21,7 +111,7 @@ class BaseUltraClient(ABC):
 
     @abstractmethod
     def _make_get_request(
-        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
         """
         Make a GET request. Implementation depends on sync/async nature.
@@ -38,7 +128,7 @@ class BaseUltraClient(ABC):
 
     @abstractmethod
     def _make_post_request(
-        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
         """
         Make a POST request. Implementation depends on sync/async nature.
@@ -54,7 +144,9 @@ class BaseUltraClient(ABC):
         pass
 
     @abstractmethod
-    def _call_order(self, request: UltraOrderRequest) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
+    def _call_order(
+        self, request: Union[UltraOrderRequest, UltraOrderParams]
+    ) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
         """
         Call the order method. Implementation depends on sync/async nature.
 
@@ -67,7 +159,9 @@ class BaseUltraClient(ABC):
         pass
 
     @abstractmethod
-    def _call_execute(self, request: UltraExecuteRequest) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
+    def _call_execute(
+        self, request: Union[UltraExecuteRequest, UltraExecuteParams]
+    ) -> Union[dict[str, Any], Awaitable[dict[str, Any]]]:
         """
         Call the execute method. Implementation depends on sync/async nature.
 
@@ -79,35 +173,137 @@ class BaseUltraClient(ABC):
         """
         pass
 
-    def _build_order_url(self) -> str:
-        """Build the order endpoint URL."""
-        return f"{self.base_url}/ultra/v1/order"  # type: ignore[attr-defined]
+    def _handle_response(self, response) -> dict[str, Any]:
+        """
+        Handle HTTP response and convert errors to custom exceptions.
+
+        Shared by the sync and async clients: curl_cffi hands back a fully
+        read response in both cases, so no awaiting is needed here.
+
+        Args:
+            response: The HTTP response object from curl_cffi.
+
+        Returns:
+            dict: The parsed JSON response data.
 
-    def _build_execute_url(self) -> str:
-        """Build the execute endpoint URL."""
-        return f"{self.base_url}/ultra/v1/execute"  # type: ignore[attr-defined]
+        Raises:
+            JupiterAuthenticationError: For 401/403 status codes.
+            JupiterRateLimitError: For 429 status code.
+            JupiterAPIError: For other HTTP error status codes.
+            JupiterNetworkError: For network-related errors.
+            JupiterValidationError: For invalid response data.
+        """
+        try:
+            _raise_for_status(response)
+            response_data = orjson.loads(response.content)
+
+            # Validate response structure
+            if not isinstance(response_data, dict):
+                raise JupiterValidationError(
+                    "Invalid response format: expected JSON object", value=type(response_data).__name__
+                )
+
+            # Check for API error messages
+            error_message = response_data.get(_ERROR_MESSAGE_KEY)
+            if error_message is not None:
+                raise JupiterAPIError(
+                    f"API Error: {error_message}",
+                    status_code=response.status_code,
+                    response_data=response_data,
+                )
+
+            return response_data  # type: ignore[no-any-return]
+
+        except Exception as e:
+            # Handle network errors and other exceptions
+            if isinstance(
+                e, (JupiterAPIError, JupiterAuthenticationError, JupiterRateLimitError, JupiterValidationError)
+            ):
+                # Re-raise our custom exceptions
+                raise
+
+            # Convert other exceptions to network errors
+            raise JupiterNetworkError(f"Network error occurred: {e!s}", original_error=e) from e
+
+    def _init_endpoint_urls(self) -> None:
+        """Precompute the endpoint URLs, which only depend on the base URL."""
+        ultra_url = f"{self.base_url}/ultra/v1"  # type: ignore[attr-defined]
+        self._order_url = f"{ultra_url}/order"
+        self._execute_url = f"{ultra_url}/execute"
+        self._balances_url_prefix = f"{ultra_url}/balances/"
+        self._shield_url = f"{ultra_url}/shield"
+
+    def _prepare_order_params(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
+        """Prepare parameters for order request; plain params are copied without validation."""
+        if isinstance(request, UltraOrderRequest):
+            return request.to_dict()
+        return dict(request)
+
+    def _prepare_execute_payload(self, request: Union[UltraExecuteRequest, UltraExecuteParams]) -> dict[str, Any]:
+        """Prepare payload for execute request; plain params are sent as given."""
+        if isinstance(request, UltraExecuteRequest):
+            return request.to_dict()
+        return request  # type: ignore[return-value]
+
+    def _prepare_shield_params(self, mints: Sequence[str]) -> dict[str, str]:
+        """Prepare parameters for shield request."""
+        return {"mints": _join_mints(tuple(mints))}
 
-    def _build_balances_url(self, address: str) -> str:
-        """Build the balances endpoint URL."""
-        return f"{self.base_url}/ultra/v1/balances/{address}"  # type: ignore[attr-defined]
+    def _init_shield_cache(self, shield_cache_ttl: Optional[float]) -> None:
+        """
+        Set up the shield response cache.
 
-    def _build_shield_url(self) -> str:
-        """Build the shield endpoint URL."""
-        return f"{self.base_url}/ultra/v1/shield"  # type: ignore[attr-defined]
+        Args:
+            shield_cache_ttl: Seconds to keep shield results for each mint.
+                Caching is disabled when None.
+        """
+        self._shield_cache = TTLCache(shield_cache_ttl) if shield_cache_ttl is not None else None
 
-    def _prepare_order_params(self, request: UltraOrderRequest) -> dict[str, Any]:
-        """Prepare parameters for order request."""
-        return request.to_dict()
+    def _split_cached_shield_mints(self, mints: Sequence[str]) -> tuple[dict[str, Any], list[str]]:
+        """
+        Look up mints in the shield cache.
 
-    def _prepare_execute_payload(self, request: UltraExecuteRequest) -> dict[str, Any]:
-        """Prepare payload for execute request."""
-        return request.to_dict()
+        Args:
+            mints: List of token mint addresses.
 
-    def _prepare_shield_params(self, mints: list[str]) -> dict[str, str]:
-        """Prepare parameters for shield request."""
-        return {"mints": ",".join(mints)}
+        Returns:
+            Tuple of the cached warnings keyed by mint, and the mints that
+            still need to be fetched from the API.
+        """
+        warnings: dict[str, Any] = {}
+        missing: list[str] = []
+        for mint in mints:
+            cached = self._shield_cache.get(mint, _NOT_CACHED)  # type: ignore[union-attr]
+            if cached is _NOT_CACHED:
+                missing.append(mint)
+            elif cached is not None:
+                # Decode a fresh copy so callers can never mutate the cached entry
+                warnings[mint] = orjson.loads(cached)
+        return warnings, missing
+
+    def _cache_shield_response(self, mints: list[str], response: dict[str, Any]) -> dict[str, Any]:
+        """
+        Store the per-mint warnings from a shield response in the cache.
+
+        Mints without warnings are cached too, so repeated lookups of safe
+        tokens do not hit the network either. Warnings are stored as immutable
+        JSON bytes, so editing a returned result never changes the cache.
+
+        Args:
+            mints: The mints that were requested.
+            response: Response from the shield endpoint.
 
-    def _prepare_execute_request_from_order(self, order_response: dict[str, Any]) -> UltraExecuteRequest:
+        Returns:
+            The warnings mapping from the response.
+        """
+        warnings = response.get("warnings") or {}
+        for mint in mints:
+            mint_warnings = warnings.get(mint)
+            cached = orjson.dumps(mint_warnings) if mint_warnings is not None else None
+            self._shield_cache.set(mint, cached)  # type: ignore[union-attr]
+        return warnings
+
+    def _prepare_execute_request_from_order(self, order_response: dict[str, Any]) -> UltraExecuteParams:
         """
         Prepare execute request from order response.
 
@@ -115,33 +311,30 @@ class BaseUltraClient(ABC):
             order_response: Response from the order endpoint.
 
         Returns:
-            UltraExecuteRequest prepared for execution.
+            Execute payload prepared for execution, built without a model.
 
         Raises:
             JupiterValidationError: If order response is missing required fields.
         """
-        # Validate order response structure
-        if not isinstance(order_response, dict):
+        try:
+            request_id = order_response["requestId"]
+            transaction_data = order_response["transaction"]
+        except KeyError as e:
+            field = e.args[0]
+            raise JupiterValidationError(f"Order response missing required field: {field}", field=field) from e
+        except TypeError as e:
             raise JupiterValidationError(
                 "Invalid order response: expected dictionary", value=type(order_response).__name__
-            )
+            ) from e
 
-        if "requestId" not in order_response:
-            raise JupiterValidationError("Order response missing required field: requestId", field="requestId")
-
-        if "transaction" not in order_response:
-            raise JupiterValidationError("Order response missing required field: transaction", field="transaction")
-
-        transaction_data = order_response["transaction"]
         if not transaction_data or not isinstance(transaction_data, str):
             raise JupiterValidationError(
                 "Order response contains invalid transaction data", field="transaction", value=transaction_data
             )
 
-        request_id = order_response["requestId"]
         signed_transaction = self._sign_base64_transaction(transaction_data)  # type: ignore[attr-defined]
 
-        return UltraExecuteRequest(
-            request_id=request_id,
-            signed_transaction=self._serialize_versioned_transaction(signed_transaction),  # type: ignore[attr-defined]
-        )
+        return {
+            "signedTransaction": self._serialize_versioned_transaction(signed_transaction),  # type: ignore[attr-defined]
+            "requestId": request_id,
+        }
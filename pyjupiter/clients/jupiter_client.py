@@ -1,13 +1,41 @@
-import base64
-import json
 import os
-from typing import Any, Optional
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType, TracebackType
+from typing import Any, Optional, TypeVar
 
-import base58
-from curl_cffi import AsyncSession, requests
+import orjson
+from curl_cffi import AsyncSession, CurlHttpVersion, requests
 from solders.solders import Keypair, VersionedTransaction
 
 from pyjupiter.exceptions import JupiterValidationError
+from pyjupiter.utils import b58, b64
+
+_JupiterClientT = TypeVar("_JupiterClientT", bound="JupiterClient")
+_AsyncJupiterClientT = TypeVar("_AsyncJupiterClientT", bound="AsyncJupiterClient")
+
+# Default session options: reuse a single HTTP/2 connection across requests
+# while keeping a browser TLS fingerprint.
+_DEFAULT_SESSION_KWARGS: dict[str, Any] = {
+    "http_version": CurlHttpVersion.V2_0,
+    "impersonate": "chrome120",
+}
+
+# AsyncSession additionally caps concurrent transfers at max_clients (curl_cffi
+# defaults to 10), so allow more requests in flight on the shared connection pool.
+_DEFAULT_ASYNC_SESSION_KWARGS: dict[str, Any] = {
+    **_DEFAULT_SESSION_KWARGS,
+    "max_clients": 64,
+}
+
+
+_API_BASE_URL = "https://api.jup.ag"
+_LITE_API_BASE_URL = "https://lite-api.jup.ag"
+
+# Header templates; the API key header is added per client when a key is set
+_BASE_HEADERS: Mapping[str, str] = MappingProxyType({"Accept": "application/json"})
+_JSON_CONTENT_TYPE_HEADER: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+_API_KEY_HEADER = "x-api-key"
 
 
 class _CoreJupiterClient:
@@ -27,29 +55,72 @@ class _CoreJupiterClient:
                 private key. Defaults to 'PRIVATE_KEY'.
         """
         self.api_key = api_key
-        self.base_url = "https://api.jup.ag" if api_key else "https://lite-api.jup.ag"
+        self.base_url = _API_BASE_URL if api_key else _LITE_API_BASE_URL
         self.private_key_env_var = private_key_env_var
-
-    def _get_headers(self) -> dict[str, str]:
+        headers = dict(_BASE_HEADERS)
+        if api_key:
+            headers[_API_KEY_HEADER] = api_key
+        self._headers: Mapping[str, str] = MappingProxyType(headers)
+        self._json_headers: Mapping[str, str] = MappingProxyType({**headers, **_JSON_CONTENT_TYPE_HEADER})
+        # The key is read from the environment once and reused for every signature
+        self._private_key_bytes: Optional[bytes] = None
+        self._keypair: Optional[Keypair] = None
+        self._public_key: Optional[str] = None
+        self._key_lock = threading.Lock()
+
+    def _get_headers(self) -> Mapping[str, str]:
         """
         Get headers for HTTP requests.
 
-        Note: Content-Type header is automatically set by curl_cffi when using
-        the json= parameter for POST requests, so it's not included here.
+        The headers are built once in __init__ and shared read-only across requests.
+
+        Returns:
+            Mapping containing headers with Accept and optional API key.
+        """
+        return self._headers
+
+    def _get_json_headers(self) -> Mapping[str, str]:
+        """
+        Get headers for requests with a pre-serialized JSON body.
 
         Returns:
-            Dict containing headers with Accept and optional API key.
+            Mapping containing the request headers plus a JSON Content-Type.
         """
-        headers = {
-            "Accept": "application/json",
-        }
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
-        return headers
+        return self._json_headers
 
     def _load_private_key_bytes(self) -> bytes:
         """
-        Loads the private key from the environment variable as base58 or uint8 array.
+        Return the private key bytes, reading them from the environment on first use.
+
+        Returns:
+            bytes: The private key as bytes.
+
+        Raises:
+            JupiterValidationError: If the private key is missing, empty, or invalid.
+        """
+        if self._private_key_bytes is None:
+            with self._key_lock:
+                if self._private_key_bytes is None:
+                    self._private_key_bytes = self._read_private_key_bytes()
+        return self._private_key_bytes
+
+    def _get_keypair(self) -> Keypair:
+        """
+        Return the signing keypair, constructing it from the private key on first use.
+
+        Returns:
+            Keypair: The wallet keypair.
+        """
+        if self._keypair is None:
+            private_key_bytes = self._load_private_key_bytes()
+            with self._key_lock:
+                if self._keypair is None:
+                    self._keypair = Keypair.from_bytes(private_key_bytes)
+        return self._keypair
+
+    def _read_private_key_bytes(self) -> bytes:
+        """
+        Reads the private key from the environment variable as base58 or uint8 array.
 
         Returns:
             bytes: The private key as bytes.
@@ -74,10 +145,10 @@ class _CoreJupiterClient:
                 value="",
             )
 
-        # Handle uint8 array format [1, 2, 3, ...]
-        if pk_raw.startswith("[") and pk_raw.endswith("]"):
+        # Handle uint8 array format [1, 2, 3, ...]; the JSON parser reports a missing "]"
+        if pk_raw[0] == "[":
             try:
-                arr = json.loads(pk_raw)
+                arr = orjson.loads(pk_raw)
                 if not isinstance(arr, list):
                     raise JupiterValidationError(
                         "Private key uint8 array must be a list",
@@ -90,17 +161,19 @@ class _CoreJupiterClient:
                         "Private key uint8 array cannot be empty", field=self.private_key_env_var, value=arr
                     )
 
-                if not all(isinstance(x, int) and 0 <= x <= 255 for x in arr):
+                # bytes() rejects non-ints and out-of-range values itself; only
+                # scan element by element to build the error message
+                try:
+                    return bytes(arr)
+                except (TypeError, ValueError) as e:
                     invalid_values = [x for x in arr if not isinstance(x, int) or not (0 <= x <= 255)]
                     raise JupiterValidationError(
                         f"Private key uint8 array contains invalid values: {invalid_values[:5]}...",
                         field=self.private_key_env_var,
                         value=invalid_values[:5],
-                    )
-
-                return bytes(arr)
+                    ) from e
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 raise JupiterValidationError(
                     f"Invalid JSON format in private key uint8 array: {e!s}",
                     field=self.private_key_env_var,
@@ -116,7 +189,7 @@ class _CoreJupiterClient:
 
         # Handle base58 format
         try:
-            decoded = base58.b58decode(pk_raw)
+            decoded = b58.b58decode(pk_raw)
             if len(decoded) == 0:
                 raise JupiterValidationError(
                     "Private key base58 decoded to empty bytes",
@@ -138,8 +211,9 @@ class _CoreJupiterClient:
         Returns:
             Public key as a base58-encoded string.
         """
-        wallet = Keypair.from_bytes(self._load_private_key_bytes())
-        return str(wallet.pubkey())
+        if self._public_key is None:
+            self._public_key = str(self._get_keypair().pubkey())
+        return self._public_key
 
     async def get_public_key_async(self) -> str:
         """
@@ -148,7 +222,9 @@ class _CoreJupiterClient:
         Returns:
             Public key as a base58-encoded string.
         """
-        return self.get_public_key()
+        # Call the core implementation directly: AsyncJupiterClient overrides
+        # get_public_key as a coroutine
+        return _CoreJupiterClient.get_public_key(self)
 
     def _sign_base64_transaction(self, transaction_base64: str) -> VersionedTransaction:
         """
@@ -176,7 +252,7 @@ class _CoreJupiterClient:
             )
 
         try:
-            transaction_bytes = base64.b64decode(transaction_base64)
+            transaction_bytes = b64.b64decode(transaction_base64)
             if len(transaction_bytes) == 0:
                 raise JupiterValidationError(
                     "Transaction base64 decoded to empty bytes",
@@ -185,7 +261,7 @@ class _CoreJupiterClient:
                 )
 
             versioned_transaction = VersionedTransaction.from_bytes(transaction_bytes)
-            return self._sign_versioned_transaction(versioned_transaction)
+            return self._sign_versioned_transaction(versioned_transaction, self._get_keypair())
 
         except JupiterValidationError:
             # Re-raise our custom validation errors
@@ -205,25 +281,32 @@ class _CoreJupiterClient:
                     field="transaction",
                 ) from e
 
-    def _sign_versioned_transaction(self, versioned_transaction: VersionedTransaction) -> VersionedTransaction:
+    def _sign_versioned_transaction(
+        self, versioned_transaction: VersionedTransaction, wallet: Optional[Keypair] = None
+    ) -> VersionedTransaction:
         """
         Sign a VersionedTransaction with the loaded private key.
 
         Args:
             versioned_transaction: VersionedTransaction to sign.
+            wallet: Optional keypair already resolved by the caller. Defaults
+                to the client's cached keypair.
 
         Returns:
             Signed VersionedTransaction with signature applied.
         """
-        wallet = Keypair.from_bytes(self._load_private_key_bytes())
-        account_keys = versioned_transaction.message.account_keys
-        wallet_index = account_keys.index(wallet.pubkey())
-
+        if wallet is None:
+            wallet = self._get_keypair()
+        message = versioned_transaction.message
         signers = list(versioned_transaction.signatures)
+
+        # Required signers are the leading account keys, one per signature slot,
+        # so only those need to be searched for the wallet
+        wallet_index = message.account_keys[: len(signers)].index(wallet.pubkey())
         signers[wallet_index] = wallet  # type: ignore
 
         return VersionedTransaction(
-            versioned_transaction.message,
+            message,
             signers,  # type: ignore
         )
 
@@ -237,7 +320,7 @@ class _CoreJupiterClient:
         Returns:
             Base64-encoded string representation of the transaction.
         """
-        return base64.b64encode(bytes(versioned_transaction)).decode("utf-8")
+        return b64.b64encode_as_string(bytes(versioned_transaction))
 
 
 class JupiterClient(_CoreJupiterClient):
@@ -260,20 +343,33 @@ class JupiterClient(_CoreJupiterClient):
             private_key_env_var: Name of environment variable containing the
                 private key.
             client_kwargs: Optional kwargs to pass to curl_cffi Session.
-                Common options include 'proxies', 'timeout'.
+                Common options include 'proxies', 'timeout'. These override
+                the defaults of HTTP/2 with a Chrome TLS fingerprint.
         """
         super().__init__(api_key, private_key_env_var)
-        kwargs = client_kwargs or {}
+        kwargs = {**_DEFAULT_SESSION_KWARGS, **(client_kwargs or {})}
         self.client = requests.Session(**kwargs)
 
     def close(self) -> None:
         """
         Close the underlying HTTP session.
 
-        Always call this method when done to properly cleanup resources.
+        Always call this method when done to properly cleanup resources,
+        or use the client as a context manager to close it automatically.
         """
         self.client.close()
 
+    def __enter__(self: _JupiterClientT) -> _JupiterClientT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
 
 class AsyncJupiterClient(_CoreJupiterClient):
     """
@@ -295,20 +391,34 @@ class AsyncJupiterClient(_CoreJupiterClient):
             private_key_env_var: Name of environment variable containing the
                 private key.
             client_kwargs: Optional kwargs to pass to curl_cffi AsyncSession.
-                Common options include 'proxies', 'timeout'.
+                Common options include 'proxies', 'timeout', 'max_clients'.
+                These override the defaults of HTTP/2 with a Chrome TLS
+                fingerprint and up to 64 concurrent transfers.
         """
         super().__init__(api_key, private_key_env_var)
-        kwargs = client_kwargs or {}
+        kwargs = {**_DEFAULT_ASYNC_SESSION_KWARGS, **(client_kwargs or {})}
         self.client = AsyncSession(**kwargs)
 
     async def close(self) -> None:
         """
         Close the underlying HTTP session.
 
-        Always call this method when done to properly cleanup resources.
+        Always call this method when done to properly cleanup resources,
+        or use the client as an async context manager to close it automatically.
         """
         await self.client.close()
 
+    async def __aenter__(self: _AsyncJupiterClientT) -> _AsyncJupiterClientT:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
     # Override get_public_key for async context consistency
     async def get_public_key(self) -> str:  # type: ignore[override]
         """
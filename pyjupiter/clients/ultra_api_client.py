@@ -1,21 +1,17 @@
-import contextlib
-from typing import Any, Optional
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional, Union
 
-from curl_cffi.requests import RequestsError
+import orjson
 
 from pyjupiter.clients.base_ultra_client import BaseUltraClient
 from pyjupiter.clients.jupiter_client import AsyncJupiterClient, JupiterClient
-from pyjupiter.exceptions import (
-    JupiterAPIError,
-    JupiterAuthenticationError,
-    JupiterNetworkError,
-    JupiterRateLimitError,
-    JupiterValidationError,
-)
 from pyjupiter.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteParams,
     UltraExecuteRequest,
 )
 from pyjupiter.models.ultra_api.ultra_order_request_model import (
+    UltraOrderParams,
     UltraOrderRequest,
 )
 
@@ -25,156 +21,85 @@ class UltraApiClient(JupiterClient, BaseUltraClient):
     A synchronous client for interacting with the Jupiter Ultra API.
     """
 
-    def _handle_response(self, response) -> dict[str, Any]:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        private_key_env_var: str = "PRIVATE_KEY",
+        client_kwargs: Optional[dict[str, Any]] = None,
+        shield_cache_ttl: Optional[float] = None,
+    ):
         """
-        Handle HTTP response and convert errors to custom exceptions.
+        Initialize the synchronous Ultra API client.
 
         Args:
-            response: The HTTP response object from curl_cffi.
-
-        Returns:
-            dict: The parsed JSON response data.
-
-        Raises:
-            JupiterAuthenticationError: For 401/403 status codes.
-            JupiterRateLimitError: For 429 status code.
-            JupiterAPIError: For other HTTP error status codes.
-            JupiterNetworkError: For network-related errors.
-            JupiterValidationError: For invalid response data.
+            api_key: Optional API key for enhanced access to Jupiter API.
+            private_key_env_var: Name of environment variable containing the
+                private key.
+            client_kwargs: Optional kwargs to pass to curl_cffi Session.
+            shield_cache_ttl: Optional number of seconds to cache shield
+                results per mint. Caching is disabled by default.
         """
-        try:
-            response.raise_for_status()
-            response_data = response.json()
-
-            # Validate response structure
-            if not isinstance(response_data, dict):
-                raise JupiterValidationError(
-                    "Invalid response format: expected JSON object", value=type(response_data).__name__
-                )
-
-            # Check for API error messages
-            if "errorMessage" in response_data:
-                raise JupiterAPIError(
-                    f"API Error: {response_data['errorMessage']}",
-                    status_code=response.status_code,
-                    response_data=response_data,
-                )
-
-            return response_data  # type: ignore[no-any-return]
-
-        except RequestsError as e:
-            status_code = e.response.status_code if hasattr(e, "response") and e.response else None
-
-            # Try to get response data for error details
-            response_data = {}
-            try:
-                if hasattr(e, "response") and e.response:
-                    response_data = e.response.json()
-            except Exception:
-                # If we can't parse the response, just use the status code
-                pass
-
-            if status_code == 401:
-                raise JupiterAuthenticationError(
-                    "Authentication failed: Invalid API key or unauthorized access",
-                    status_code=status_code,
-                    response_data=response_data,
-                ) from e
-            elif status_code == 403:
-                raise JupiterAuthenticationError(
-                    "Access forbidden: Insufficient permissions", status_code=status_code, response_data=response_data
-                ) from e
-            elif status_code == 429:
-                # Extract retry-after header if available
-                retry_after = None
-                if hasattr(e, "response") and e.response and hasattr(e.response, "headers"):
-                    retry_after_header = e.response.headers.get("retry-after")
-                    if retry_after_header:
-                        with contextlib.suppress(ValueError):
-                            retry_after = int(retry_after_header)
-
-                raise JupiterRateLimitError(
-                    "Rate limit exceeded. Please try again later.",
-                    retry_after=retry_after,
-                    status_code=status_code,
-                    response_data=response_data,
-                ) from e
-            else:
-                error_message = f"HTTP {status_code} error"
-                if response_data and "errorMessage" in response_data:
-                    error_message = response_data["errorMessage"]
-                elif response_data and "message" in response_data:
-                    error_message = response_data["message"]
-
-                raise JupiterAPIError(error_message, status_code=status_code, response_data=response_data) from e
-
-        except Exception as e:
-            # Handle network errors and other exceptions
-            if isinstance(
-                e, (JupiterAPIError, JupiterAuthenticationError, JupiterRateLimitError, JupiterValidationError)
-            ):
-                # Re-raise our custom exceptions
-                raise
-
-            # Convert other exceptions to network errors
-            raise JupiterNetworkError(f"Network error occurred: {e!s}", original_error=e) from e
+        super().__init__(api_key, private_key_env_var, client_kwargs)
+        self._init_endpoint_urls()
+        self._init_shield_cache(shield_cache_ttl)
 
     def _make_get_request(
-        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> dict[str, Any]:
         """Make a synchronous GET request."""
         response = self.client.get(url, params=params, headers=headers)
         return self._handle_response(response)
 
     def _make_post_request(
-        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> dict[str, Any]:
-        """Make a synchronous POST request."""
-        response = self.client.post(url, json=json, headers=headers)
+        """Make a synchronous POST request, serializing the JSON payload with orjson."""
+        data = orjson.dumps(json) if json is not None else None
+        response = self.client.post(url, data=data, headers=headers)
         return self._handle_response(response)
 
-    def _call_order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def _call_order(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """Call the synchronous order method."""
         return self.order(request)
 
-    def _call_execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+    def _call_execute(self, request: Union[UltraExecuteRequest, UltraExecuteParams]) -> dict[str, Any]:
         """Call the synchronous execute method."""
         return self.execute(request)
 
-    def order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def order(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """
         Get an order from the Jupiter Ultra API (synchronous).
 
         Args:
-            request (UltraOrderRequest): The request parameters for the order.
+            request (UltraOrderRequest | UltraOrderParams): The request parameters for the order.
 
         Returns:
             dict: The dict api response.
         """
         params = self._prepare_order_params(request)
-        url = self._build_order_url()
+        url = self._order_url
         return self._make_get_request(url, params=params, headers=self._get_headers())
 
-    def execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+    def execute(self, request: Union[UltraExecuteRequest, UltraExecuteParams]) -> dict[str, Any]:
         """
         Execute the order with the Jupiter Ultra API (synchronous).
 
         Args:
-            request (UltraExecuteRequest): The execute request parameters.
+            request (UltraExecuteRequest | UltraExecuteParams): The execute request parameters.
 
         Returns:
             dict: The dict api response.
         """
         payload = self._prepare_execute_payload(request)
-        url = self._build_execute_url()
-        return self._make_post_request(url, json=payload, headers=self._get_headers())
+        url = self._execute_url
+        return self._make_post_request(url, json=payload, headers=self._get_json_headers())
 
-    def order_and_execute(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def order_and_execute(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """
         Get and execute an order in a single call (synchronous).
 
         Args:
-            request (UltraOrderRequest): The request parameters for the order.
+            request (UltraOrderRequest | UltraOrderParams): The request parameters for the order.
 
         Returns:
             dict: The dict api response.
@@ -193,23 +118,34 @@ class UltraApiClient(JupiterClient, BaseUltraClient):
         Returns:
             dict: The dict api response.
         """
-        url = self._build_balances_url(address)
+        url = self._balances_url_prefix + address
         return self._make_get_request(url, headers=self._get_headers())
 
-    def shield(self, mints: list[str]) -> dict[str, Any]:
+    def shield(self, mints: Sequence[str]) -> dict[str, Any]:
         """
         Get token info and warnings for specific mints (synchronous).
 
+        When shield caching is enabled, mints with a fresh cached result are
+        served locally and only the remaining mints are requested.
+
         Args:
-            mints (list[str]): List of token mint addresses
+            mints (Sequence[str]): List or tuple of token mint addresses
             to get information for.
 
         Returns:
             dict: The dict api response with warnings information.
         """
-        params = self._prepare_shield_params(mints)
-        url = self._build_shield_url()
-        return self._make_get_request(url, params=params, headers=self._get_headers())
+        url = self._shield_url
+        if self._shield_cache is None:
+            params = self._prepare_shield_params(mints)
+            return self._make_get_request(url, params=params, headers=self._get_headers())
+
+        warnings, missing = self._split_cached_shield_mints(mints)
+        if missing:
+            params = self._prepare_shield_params(missing)
+            response = self._make_get_request(url, params=params, headers=self._get_headers())
+            warnings.update(self._cache_shield_response(missing, response))
+        return {"warnings": warnings}
 
 
 class AsyncUltraApiClient(AsyncJupiterClient, BaseUltraClient):
@@ -217,161 +153,104 @@ class AsyncUltraApiClient(AsyncJupiterClient, BaseUltraClient):
     An asynchronous client for interacting with the Jupiter Ultra API.
     """
 
-    async def _handle_response(self, response) -> dict[str, Any]:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        private_key_env_var: str = "PRIVATE_KEY",
+        client_kwargs: Optional[dict[str, Any]] = None,
+        shield_cache_ttl: Optional[float] = None,
+    ):
         """
-        Handle HTTP response and convert errors to custom exceptions (async version).
+        Initialize the asynchronous Ultra API client.
 
         Args:
-            response: The HTTP response object from curl_cffi.
-
-        Returns:
-            dict: The parsed JSON response data.
-
-        Raises:
-            JupiterAuthenticationError: For 401/403 status codes.
-            JupiterRateLimitError: For 429 status code.
-            JupiterAPIError: For other HTTP error status codes.
-            JupiterNetworkError: For network-related errors.
-            JupiterValidationError: For invalid response data.
+            api_key: Optional API key for enhanced access to Jupiter API.
+            private_key_env_var: Name of environment variable containing the
+                private key.
+            client_kwargs: Optional kwargs to pass to curl_cffi AsyncSession.
+            shield_cache_ttl: Optional number of seconds to cache shield
+                results per mint. Caching is disabled by default.
         """
-        try:
-            response.raise_for_status()
-            response_data = response.json()
-
-            # Validate response structure
-            if not isinstance(response_data, dict):
-                raise JupiterValidationError(
-                    "Invalid response format: expected JSON object", value=type(response_data).__name__
-                )
-
-            # Check for API error messages
-            if "errorMessage" in response_data:
-                raise JupiterAPIError(
-                    f"API Error: {response_data['errorMessage']}",
-                    status_code=response.status_code,
-                    response_data=response_data,
-                )
-
-            return response_data  # type: ignore[no-any-return]
-
-        except RequestsError as e:
-            status_code = e.response.status_code if hasattr(e, "response") and e.response else None
-
-            # Try to get response data for error details
-            response_data = {}
-            try:
-                if hasattr(e, "response") and e.response:
-                    response_data = e.response.json()
-            except Exception:
-                # If we can't parse the response, just use the status code
-                pass
-
-            if status_code == 401:
-                raise JupiterAuthenticationError(
-                    "Authentication failed: Invalid API key or unauthorized access",
-                    status_code=status_code,
-                    response_data=response_data,
-                ) from e
-            elif status_code == 403:
-                raise JupiterAuthenticationError(
-                    "Access forbidden: Insufficient permissions", status_code=status_code, response_data=response_data
-                ) from e
-            elif status_code == 429:
-                # Extract retry-after header if available
-                retry_after = None
-                if hasattr(e, "response") and e.response and hasattr(e.response, "headers"):
-                    retry_after_header = e.response.headers.get("retry-after")
-                    if retry_after_header:
-                        with contextlib.suppress(ValueError):
-                            retry_after = int(retry_after_header)
-
-                raise JupiterRateLimitError(
-                    "Rate limit exceeded. Please try again later.",
-                    retry_after=retry_after,
-                    status_code=status_code,
-                    response_data=response_data,
-                ) from e
-            else:
-                error_message = f"HTTP {status_code} error"
-                if response_data and "errorMessage" in response_data:
-                    error_message = response_data["errorMessage"]
-                elif response_data and "message" in response_data:
-                    error_message = response_data["message"]
-
-                raise JupiterAPIError(error_message, status_code=status_code, response_data=response_data) from e
-
-        except Exception as e:
-            # Handle network errors and other exceptions
-            if isinstance(
-                e, (JupiterAPIError, JupiterAuthenticationError, JupiterRateLimitError, JupiterValidationError)
-            ):
-                # Re-raise our custom exceptions
-                raise
-
-            # Convert other exceptions to network errors
-            raise JupiterNetworkError(f"Network error occurred: {e!s}", original_error=e) from e
+        super().__init__(api_key, private_key_env_var, client_kwargs)
+        self._init_endpoint_urls()
+        self._init_shield_cache(shield_cache_ttl)
 
     async def _make_get_request(
-        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> dict[str, Any]:
         """Make an asynchronous GET request."""
         response = await self.client.get(url, params=params, headers=headers)
-        return await self._handle_response(response)
+        return self._handle_response(response)
 
     async def _make_post_request(
-        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+        self, url: str, json: Optional[dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None
     ) -> dict[str, Any]:
-        """Make an asynchronous POST request."""
-        response = await self.client.post(url, json=json, headers=headers)
-        return await self._handle_response(response)
+        """Make an asynchronous POST request, serializing the JSON payload with orjson."""
+        data = orjson.dumps(json) if json is not None else None
+        response = await self.client.post(url, data=data, headers=headers)
+        return self._handle_response(response)
 
-    async def _call_order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    async def _call_order(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """Call the asynchronous order method."""
         return await self.order(request)
 
-    async def _call_execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+    async def _call_execute(self, request: Union[UltraExecuteRequest, UltraExecuteParams]) -> dict[str, Any]:
         """Call the asynchronous execute method."""
         return await self.execute(request)
 
-    async def order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    async def order(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """
         Get an order from the Jupiter Ultra API (asynchronous).
 
         Args:
-            request (UltraOrderRequest): The request parameters for the order.
+            request (UltraOrderRequest | UltraOrderParams): The request parameters for the order.
 
         Returns:
             dict: The dict api response.
         """
         params = self._prepare_order_params(request)
-        url = self._build_order_url()
+        url = self._order_url
         return await self._make_get_request(url, params=params, headers=self._get_headers())
 
-    async def execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+    async def execute(self, request: Union[UltraExecuteRequest, UltraExecuteParams]) -> dict[str, Any]:
         """
         Execute the order with the Jupiter Ultra API (asynchronous).
 
         Args:
-            request (UltraExecuteRequest): The execute request parameters.
+            request (UltraExecuteRequest | UltraExecuteParams): The execute request parameters.
 
         Returns:
             dict: The dict api response.
         """
         payload = self._prepare_execute_payload(request)
-        url = self._build_execute_url()
-        return await self._make_post_request(url, json=payload, headers=self._get_headers())
+        url = self._execute_url
+        return await self._make_post_request(url, json=payload, headers=self._get_json_headers())
 
-    async def order_and_execute(self, request: UltraOrderRequest) -> dict[str, Any]:
+    async def order_and_execute(self, request: Union[UltraOrderRequest, UltraOrderParams]) -> dict[str, Any]:
         """
         Get and execute an order in a single call (asynchronous).
 
         Args:
-            request (UltraOrderRequest): The request parameters for the order.
+            request (UltraOrderRequest | UltraOrderParams): The request parameters for the order.
 
         Returns:
             dict: The dict api response.
         """
-        order_response = await self._call_order(request)
+        if self._keypair is not None:
+            # Key already cached by an earlier call: no tasks to schedule
+            order_response = await self._call_order(request)
+        else:
+            # Load the signing key while the order request is in flight
+            order_task = asyncio.ensure_future(self._call_order(request))
+            key_task = asyncio.ensure_future(self.get_public_key())
+            try:
+                order_response, _ = await asyncio.gather(order_task, key_task)
+            except BaseException:
+                # Collect the cancelled order so its outcome is never left unretrieved
+                order_task.cancel()
+                await asyncio.gather(order_task, return_exceptions=True)
+                raise
+
         execute_request = self._prepare_execute_request_from_order(order_response)
         return await self._call_execute(execute_request)
 
@@ -385,20 +264,31 @@ class AsyncUltraApiClient(AsyncJupiterClient, BaseUltraClient):
         Returns:
             dict: The dict api response.
         """
-        url = self._build_balances_url(address)
+        url = self._balances_url_prefix + address
         return await self._make_get_request(url, headers=self._get_headers())
 
-    async def shield(self, mints: list[str]) -> dict[str, Any]:
+    async def shield(self, mints: Sequence[str]) -> dict[str, Any]:
         """
         Get token info and warnings for specific mints (asynchronous).
 
+        When shield caching is enabled, mints with a fresh cached result are
+        served locally and only the remaining mints are requested.
+
         Args:
-            mints (list[str]): List of token mint addresses
+            mints (Sequence[str]): List or tuple of token mint addresses
             to get information for.
 
         Returns:
             dict: The dict api response with warnings information.
         """
-        params = self._prepare_shield_params(mints)
-        url = self._build_shield_url()
-        return await self._make_get_request(url, params=params, headers=self._get_headers())
+        url = self._shield_url
+        if self._shield_cache is None:
+            params = self._prepare_shield_params(mints)
+            return await self._make_get_request(url, params=params, headers=self._get_headers())
+
+        warnings, missing = self._split_cached_shield_mints(mints)
+        if missing:
+            params = self._prepare_shield_params(missing)
+            response = await self._make_get_request(url, params=params, headers=self._get_headers())
+            warnings.update(self._cache_shield_response(missing, response))
+        return {"warnings": warnings}
@@ -3,9 +3,15 @@ Custom exception hierarchy for the pyjupiter package.
 
 This module defines a comprehensive set of exceptions that provide
 better error handling and debugging capabilities for Jupiter API interactions.
+
+Each ``__init__`` sets every attribute itself and calls ``Exception.__init__``
+once instead of chaining through ``super()``, so raising an error in a retry
+loop costs a single Python frame. Attributes live in ``__slots__``, so the
+instance ``__dict__`` is only allocated if something else is attached to it,
+and empty ``details``/``response_data`` dicts are only created when read.
 """
 
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 
 class JupiterError(Exception):
@@ -14,8 +20,14 @@ class JupiterError(Exception):
 
     This is the root exception that all other Jupiter exceptions inherit from.
     Use this for general exception handling when you want to catch any Jupiter error.
+    Each class also carries a ``kind`` tag ("api", "network", "rate_limit",
+    "validation" or "auth"), so handlers catching JupiterError can branch on
+    ``error.kind`` with a string comparison instead of isinstance checks.
     """
 
+    __slots__ = ("_details", "message")
+    kind: ClassVar[str] = "error"
+
     def __init__(self, message: str, details: Optional[dict[str, Any]] = None):
         """
         Initialize the base Jupiter error.
@@ -26,7 +38,31 @@ class JupiterError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self._details = details
+
+    @property
+    def details(self) -> dict[str, Any]:
+        """Additional error details; the empty dict is only created when first accessed."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+
+    @details.setter
+    def details(self, value: dict[str, Any]) -> None:
+        self._details = value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Support pickling, which by default only restores ``__dict__`` and would drop slot attributes.
+
+        Returns:
+            The class, its constructor arguments and the attribute state to restore.
+        """
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                state[name] = getattr(self, name)
+        return type(self), self.args, state
 
 
 class JupiterAPIError(JupiterError):
@@ -37,6 +73,9 @@ class JupiterAPIError(JupiterError):
     for better debugging of API issues.
     """
 
+    __slots__ = ("_response_data", "status_code")
+    kind: ClassVar[str] = "api"
+
     def __init__(
         self,
         message: str,
@@ -53,9 +92,22 @@ class JupiterAPIError(JupiterError):
             response_data: Raw response data from the API.
             details: Optional additional error details.
         """
-        super().__init__(message, details)
+        Exception.__init__(self, message)
+        self.message = message
+        self._details = details
         self.status_code = status_code
-        self.response_data = response_data or {}
+        self._response_data = response_data
+
+    @property
+    def response_data(self) -> dict[str, Any]:
+        """Raw response data; the empty dict is only created when first accessed."""
+        if self._response_data is None:
+            self._response_data = {}
+        return self._response_data
+
+    @response_data.setter
+    def response_data(self, value: dict[str, Any]) -> None:
+        self._response_data = value
 
 
 class JupiterNetworkError(JupiterError):
@@ -66,6 +118,9 @@ class JupiterNetworkError(JupiterError):
     and other network-related problems.
     """
 
+    __slots__ = ("original_error",)
+    kind: ClassVar[str] = "network"
+
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         """
         Initialize the network error.
@@ -74,7 +129,9 @@ class JupiterNetworkError(JupiterError):
             message: Human-readable error message.
             original_error: The original exception that caused this error.
         """
-        super().__init__(message)
+        Exception.__init__(self, message)
+        self.message = message
+        self._details = None
         self.original_error = original_error
 
 
@@ -85,6 +142,9 @@ class JupiterRateLimitError(JupiterAPIError):
     This exception extends JupiterAPIError and includes retry timing information.
     """
 
+    __slots__ = ("retry_after",)
+    kind: ClassVar[str] = "rate_limit"
+
     def __init__(
         self,
         message: str,
@@ -101,7 +161,11 @@ class JupiterRateLimitError(JupiterAPIError):
             status_code: HTTP status code (typically 429).
             response_data: Raw response data from the API.
         """
-        super().__init__(message, status_code, response_data)
+        Exception.__init__(self, message)
+        self.message = message
+        self._details = None
+        self.status_code = status_code
+        self._response_data = response_data
         self.retry_after = retry_after
 
 
@@ -113,6 +177,9 @@ class JupiterValidationError(JupiterError):
     missing required fields, and other validation failures.
     """
 
+    __slots__ = ("field", "value")
+    kind: ClassVar[str] = "validation"
+
     def __init__(self, message: str, field: Optional[str] = None, value: Optional[Any] = None):
         """
         Initialize the validation error.
@@ -122,7 +189,9 @@ class JupiterValidationError(JupiterError):
             field: The field that failed validation.
             value: The invalid value that caused the error.
         """
-        super().__init__(message)
+        Exception.__init__(self, message)
+        self.message = message
+        self._details = None
         self.field = field
         self.value = value
 
@@ -135,6 +204,9 @@ class JupiterAuthenticationError(JupiterAPIError):
     insufficient permissions, and other auth-related issues.
     """
 
+    __slots__ = ()
+    kind: ClassVar[str] = "auth"
+
     def __init__(
         self,
         message: str,
@@ -149,4 +221,8 @@ class JupiterAuthenticationError(JupiterAPIError):
             status_code: HTTP status code (typically 401 or 403).
             response_data: Raw response data from the API.
         """
-        super().__init__(message, status_code, response_data)
+        Exception.__init__(self, message)
+        self.message = message
+        self._details = None
+        self.status_code = status_code
+        self._response_data = response_data
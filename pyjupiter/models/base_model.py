@@ -1,8 +1,42 @@
-from typing import Any
+from typing import Any, Callable, ClassVar, Optional, TypeVar, get_args
 
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ConfigDict
 from pydantic.alias_generators import to_camel
 
+_FLAT_FIELD_TYPES = (str, int, float, bool, type(None))
+
+_ModelT = TypeVar("_ModelT", bound="BaseModel")
+
+
+def _make_to_dict(fields: tuple[tuple[str, str], ...]) -> Callable[..., dict[str, Any]]:
+    """
+    Build a to_dict method specialized to one flat model's fields.
+
+    The returned closure walks the precomputed (camelCase key, field name)
+    pairs and reads the instance ``__dict__`` directly, skipping model_dump.
+    Fields that are None or missing (e.g. left out of ``build()``) are omitted,
+    as with ``model_dump(exclude_none=True)``.
+
+    Args:
+        fields: (camelCase key, field name) pairs in declaration order.
+
+    Returns:
+        The function, ready to be set as the class's to_dict.
+    """
+
+    def to_dict(self: "BaseModel") -> dict[str, Any]:
+        get = self.__dict__.get
+        result = {}
+        for key, name in fields:
+            value = get(name)
+            if value is not None:
+                result[key] = value
+        return result
+
+    to_dict._generated = True  # type: ignore[attr-defined]
+    return to_dict
+
 
 class BaseModel(PydanticBaseModel):
     """
@@ -11,19 +45,100 @@ class BaseModel(PydanticBaseModel):
     This class extends Pydantic's BaseModel to provide a standardized
     to_dict() method that converts model fields to camelCase format,
     which is commonly required for API requests.
+
+    Fields get camelCase aliases, computed once per class by pydantic, and
+    can still be populated by their snake_case names.
     """
 
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    # (field name, camelCase key) pairs in declaration order, or None when the
+    # class has a field that needs pydantic's serializer.
+    _dump_fields: ClassVar[Optional[tuple[tuple[str, str], ...]]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        fields = cls._flat_dump_fields()
+        generated = getattr(cls.to_dict, "_generated", False)
+        if fields is None:
+            cls._dump_fields = None
+            # A to_dict generated for a flat parent would not match this class's dump
+            if generated:
+                cls.to_dict = BaseModel.to_dict  # type: ignore[method-assign]
+            return
+        cls._dump_fields = tuple(fields)
+        # Specialize to_dict unless this class or a parent below BaseModel wrote its own
+        if cls.to_dict is BaseModel.to_dict or generated:
+            to_dict = _make_to_dict(tuple((key, name) for name, key in fields))
+            to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+            to_dict.__doc__ = BaseModel.to_dict.__doc__
+            cls.to_dict = to_dict  # type: ignore[method-assign]
+
+    @classmethod
+    def _flat_dump_fields(cls) -> Optional[list[tuple[str, str]]]:
+        """
+        Collect the fields that can be dumped straight from the instance.
+
+        Returns:
+            (field name, camelCase key) pairs in declaration order,
+            or None when reading ``__dict__`` would not match model_dump().
+        """
+        decorators = cls.__pydantic_decorators__
+        if decorators.field_serializers or decorators.model_serializers or cls.model_config.get("extra") == "allow":
+            return None
+        # Computed fields are only produced by pydantic's serializer
+        if cls.__pydantic_computed_fields__:
+            return None
+        fields = []
+        for name, field in cls.model_fields.items():
+            # Only scalar fields that default to None can be dumped straight from
+            # the instance: anything else may need serializing or be unset yet
+            # still present in model_dump().
+            if not field.is_required() and field.default is not None:
+                return None
+            # Excluded fields must never reach the API payload
+            if field.exclude or getattr(field, "exclude_if", None) is not None:
+                return None
+            # Annotated metadata such as PlainSerializer can change the dumped value
+            if field.metadata:
+                return None
+            if not all(tp in _FLAT_FIELD_TYPES for tp in get_args(field.annotation) or (field.annotation,)):
+                return None
+            fields.append((name, field.serialization_alias or field.alias or name))
+        return fields
+
+    @classmethod
+    def build(cls: type[_ModelT], **values: Any) -> _ModelT:
+        """
+        Create a model from trusted, already-typed values without validation.
+
+        Use this where values come from typed Python code; anything built from
+        user or API input should go through the normal constructor instead.
+
+        Args:
+            **values: Field values, by snake_case name or camelCase alias.
+
+        Returns:
+            The model instance, with unset optional fields left at their defaults.
+        """
+        return cls.model_construct(**values)
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the model to a dictionary with camelCase keys.
 
-        This method dumps the model fields, excludes None values,
-        and converts snake_case field names to camelCase format
-        suitable for API requests.
+        This method dumps the model fields by alias and excludes None
+        values, producing camelCase keys suitable for API requests. Flat
+        models get a to_dict generated for their fields when the class is
+        created; this generic version only visits explicitly set fields.
 
         Returns:
             Dict with camelCase keys and non-None values.
         """
-        params = self.model_dump(exclude_none=True)
-        camel_case_params = {to_camel(key): value for key, value in params.items()}
-        return camel_case_params
+        dump_fields = self._dump_fields
+        if dump_fields is None:
+            return self.model_dump(exclude_none=True, by_alias=True)
+        fields_set = self.__pydantic_fields_set__
+        values = self.__dict__
+        return {key: value for name, key in dump_fields if name in fields_set and (value := values[name]) is not None}
@@ -1,5 +1,4 @@
 from enum import Enum
-from urllib.parse import quote
 
 
 class DexEnum(str, Enum):
@@ -60,6 +59,8 @@ class DexEnum(str, Enum):
     INVARIANT = "Invariant"
     GUACSWAP = "Guacswap"
 
+    _encoded: str
+
     def __str__(self) -> str:
         """
         Return URL-encoded string representation of the DEX name.
@@ -67,4 +68,18 @@ class DexEnum(str, Enum):
         Returns:
             URL-encoded DEX name suitable for API requests.
         """
-        return quote(self.value)
+        return self._encoded
+
+
+def _precompute() -> None:
+    # Enum values never change, so encode each name once at import time and cache
+    # it for __str__. Names that need no escaping keep the value string object.
+    from urllib.parse import quote
+
+    for member in DexEnum:
+        encoded = quote(member.value)
+        member._encoded = member.value if encoded == member.value else encoded
+
+
+_precompute()
+del _precompute
@@ -1,6 +1,20 @@
+from typing import TypedDict
+
 from pyjupiter.models.base_model import BaseModel
 
 
+class UltraExecuteParams(TypedDict):
+    """
+    Execute payload keyed by its camelCase API names.
+
+    A plain-dict alternative to UltraExecuteRequest; order_and_execute builds
+    one directly instead of constructing and validating a model.
+    """
+
+    signedTransaction: str
+    requestId: str
+
+
 class UltraExecuteRequest(BaseModel):
     """
     Pydantic model for executing a previously created order.
@@ -1,8 +1,27 @@
-from typing import Optional
+from typing import Optional, TypedDict
 
 from pyjupiter.models.base_model import BaseModel
 
 
+class _UltraOrderParamsRequired(TypedDict):
+    inputMint: str
+    outputMint: str
+    amount: int
+
+
+class UltraOrderParams(_UltraOrderParamsRequired, total=False):
+    """
+    Order query parameters keyed by their camelCase API names.
+
+    A plain-dict alternative to UltraOrderRequest for callers that build many
+    orders and want to skip model validation. The values are sent as given.
+    """
+
+    taker: str
+    referralAccount: str
+    referralFee: int
+
+
 class UltraOrderRequest(BaseModel):
     """
     Pydantic model for creating swap orders on Jupiter Ultra API.
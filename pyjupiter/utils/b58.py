@@ -0,0 +1,27 @@
+"""
+Base58 helpers for private key decoding.
+
+Uses the Rust-backed based58 when it is installed (``pip install pyjupiter[fast]``)
+and falls back to the pure-Python base58 package otherwise.
+"""
+
+try:
+    import based58 as _b58
+except ImportError:  # pragma: no cover - exercised only without the extra
+    import base58 as _b58  # type: ignore[no-redef]
+
+
+def b58decode(data: str) -> bytes:
+    """
+    Decode a base58 string using the Bitcoin alphabet.
+
+    Args:
+        data: Base58-encoded text.
+
+    Returns:
+        The decoded bytes.
+
+    Raises:
+        ValueError: If the input contains characters outside the base58 alphabet.
+    """
+    return _b58.b58decode(data.encode("ascii"))
@@ -0,0 +1,47 @@
+"""
+Base64 helpers for transaction payloads.
+
+Uses pybase64 when it is installed (``pip install pyjupiter[fast]``) and falls
+back to the standard library otherwise.
+"""
+
+import base64
+from typing import Union
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pybase64 = None  # type: ignore[assignment]
+
+
+def b64decode(data: Union[bytes, str]) -> bytes:
+    """
+    Decode strictly validated base64 data.
+
+    Args:
+        data: Base64-encoded bytes or text.
+
+    Returns:
+        The decoded bytes.
+
+    Raises:
+        binascii.Error: If the input contains non-alphabet characters or bad padding.
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=True)
+    return base64.b64decode(data, validate=True)
+
+
+def b64encode_as_string(data: bytes) -> str:
+    """
+    Encode bytes to a base64 string.
+
+    Args:
+        data: Raw bytes to encode.
+
+    Returns:
+        The base64-encoded text.
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
@@ -0,0 +1,72 @@
+import time
+from collections.abc import Hashable
+from typing import Any, Optional
+
+
+class TTLCache:
+    """
+    Minimal in-memory cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted lazily: expired keys are dropped when they are read,
+    and when the cache is full the expired entries are purged before the
+    oldest remaining entry is discarded.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Number of seconds an entry stays valid after it is stored.
+            maxsize: Maximum number of entries kept in the cache.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        now = time.monotonic()
+        self._data.pop(key, None)
+
+        if len(self._data) >= self.maxsize:
+            self._data = {k: entry for k, entry in self._data.items() if entry[0] > now}
+            if len(self._data) >= self.maxsize:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._data[next(iter(self._data))]
+
+        self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,37 @@
+"""
+Event loop helpers for the async clients.
+
+Uses uvloop when it is installed (``pip install pyjupiter[fast]`` on Linux and
+macOS) and falls back to the standard asyncio loop otherwise.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - exercised only without the extra
+    uvloop = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T], *, use_uvloop: bool = True) -> T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    This is a drop-in replacement for asyncio.run() that picks uvloop when
+    available. It only affects the loop it creates, so applications that
+    manage their own loop or event loop policy are left untouched.
+
+    Args:
+        main: The coroutine to run.
+        use_uvloop: Set to False to always use the standard asyncio loop.
+
+    Returns:
+        The coroutine's result.
+    """
+    if use_uvloop and uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -1,10 +1,35 @@
+import asyncio
 import os
 
 import pytest
+from utils import load_environment
+
+from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+
+# The environment does not change during a session, so load .env and check for
+# the key once instead of on every test
+load_environment()
+_HAS_PRIVATE_KEY = bool(os.environ.get("PRIVATE_KEY"))
 
 
 @pytest.fixture(autouse=True)
 def skip_if_no_private_key(request):
     """Skip tests that require private key when it's not available."""
-    if request.node.get_closest_marker("requires_private_key") and not os.getenv("PRIVATE_KEY"):
+    if not _HAS_PRIVATE_KEY and request.node.get_closest_marker("requires_private_key"):
         pytest.skip("Test requires PRIVATE_KEY environment variable")
+
+
+@pytest.fixture(scope="session")
+def ultra_client():
+    """Default sync client shared by tests that mock its HTTP calls and keep no per-client state."""
+    client = UltraApiClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_ultra_client():
+    """Default async client shared by tests that mock its HTTP calls and keep no per-client state."""
+    client = AsyncUltraApiClient()
+    yield client
+    asyncio.run(client.close())
@@ -1,10 +1,44 @@
+import asyncio
+import base64
+import json
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Annotated, Any, Optional
 from unittest.mock import AsyncMock, Mock, patch
+from urllib.parse import parse_qs, quote, urlparse
 
+import orjson
 import pytest
+from curl_cffi import CurlHttpVersion
+from pydantic import Field, PlainSerializer, computed_field
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import MessageV0, to_bytes_versioned
+from solders.null_signer import NullSigner
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
 from utils import load_environment
 
 from pyjupiter.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
-from pyjupiter.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from pyjupiter.exceptions import (
+    JupiterAPIError,
+    JupiterAuthenticationError,
+    JupiterError,
+    JupiterNetworkError,
+    JupiterRateLimitError,
+    JupiterValidationError,
+)
+from pyjupiter.models.base_model import BaseModel
+from pyjupiter.models.common.dex_enum import DexEnum
+from pyjupiter.models.ultra_api.ultra_execute_request_model import UltraExecuteParams, UltraExecuteRequest
+from pyjupiter.models.ultra_api.ultra_order_request_model import UltraOrderParams, UltraOrderRequest
+from pyjupiter.utils import eventloop
+from pyjupiter.utils.cache import TTLCache
 
 
 def test_sync_client_initialization():
@@ -89,23 +123,180 @@ def test_order_request_model():
     assert "taker" in order_dict
 
 
+def test_dex_enum_str_is_url_encoded():
+    """Test DexEnum members stringify to their precomputed URL-encoded names"""
+    for dex in DexEnum:
+        assert str(dex) == quote(dex.value)
+    assert str(DexEnum.LIFINITY_V2) == "Lifinity%20V2"
+    assert DexEnum("Lifinity V2") is DexEnum.LIFINITY_V2
+    # The member's string content stays the raw name; only str() is encoded
+    assert DexEnum.LIFINITY_V2 == "Lifinity V2"
+    assert ",".join([DexEnum.LIFINITY_V2, DexEnum.WOOFI]) == "Lifinity V2,Woofi"
+    assert json.dumps(DexEnum.LIFINITY_V2) == orjson.dumps(DexEnum.LIFINITY_V2).decode() == '"Lifinity V2"'
+    # Names without reserved characters reuse the value string itself
+    assert str(DexEnum.WOOFI) is DexEnum.WOOFI.value
+
+
+def test_dex_enum_query_param_encoded_once():
+    """Test DEX names joined into query params reach the server encoded exactly once"""
+    paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            paths.append(self.path)
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with UltraApiClient() as client:
+            url = f"http://127.0.0.1:{server.server_port}/order"
+            client._make_get_request(url, params={"dexes": ",".join([DexEnum.LIFINITY_V2, DexEnum.WOOFI])})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "%2520" not in paths[0]
+    assert parse_qs(urlparse(paths[0]).query)["dexes"] == ["Lifinity V2,Woofi"]
+
+
+def test_request_models_to_dict_matches_generic_dump():
+    """Generated to_dict methods must match the generic camelCase dump"""
+    orders = [
+        UltraOrderRequest(input_mint="a", output_mint="b", amount=1),
+        UltraOrderRequest(input_mint="a", output_mint="b", amount=1, taker="t", referral_account="r", referral_fee=50),
+    ]
+    for order in orders:
+        assert order.to_dict() == BaseModel.to_dict(order)
+        assert BaseModel.to_dict(order) == order.model_dump(exclude_none=True, by_alias=True)
+
+    # Fields assigned after construction are picked up by the generic fast path
+    orders[0].taker = "late"
+    assert BaseModel.to_dict(orders[0])["taker"] == "late"
+    orders[0].taker = None
+
+    # Fields accept their camelCase aliases as well as their snake_case names
+    assert UltraOrderRequest(inputMint="a", outputMint="b", amount=1) == orders[0]  # type: ignore[call-arg]
+
+    # build() skips validation but produces the same model and payload
+    built = UltraOrderRequest.build(input_mint="a", output_mint="b", amount=1, referralFee=50)
+    assert built.to_dict() == {"inputMint": "a", "outputMint": "b", "amount": 1, "referralFee": 50}
+    assert BaseModel.to_dict(built) == built.to_dict()
+    assert UltraOrderRequest.build(input_mint="a", output_mint="b", amount=1) == orders[0]
+    # A required field left out of build() is omitted, as model_dump does
+    partial = UltraOrderRequest.build(input_mint="a", output_mint="b")
+    assert partial.to_dict() == partial.model_dump(exclude_none=True, by_alias=True)
+    assert partial.to_dict() == {"inputMint": "a", "outputMint": "b"}
+
+    execute = UltraExecuteRequest(signed_transaction="tx", request_id="id")
+    assert execute.to_dict() == BaseModel.to_dict(execute)
+    assert execute.to_dict() == {"signedTransaction": "tx", "requestId": "id"}
+
+
+def test_base_model_to_dict_falls_back_for_nested_models():
+    """Models with nested or non-None default fields are dumped by pydantic"""
+
+    class Inner(BaseModel):
+        slippage_bps: int = 50
+
+    class Outer(BaseModel):
+        inner: Optional[Inner] = None
+
+    assert Inner._dump_fields is None
+    assert Outer._dump_fields is None
+    assert Outer(inner=Inner()).to_dict() == {"inner": {"slippageBps": 50}}
+
+    class Excluded(BaseModel):
+        a: str
+        secret: Optional[str] = Field(default=None, exclude=True)
+
+    class Computed(BaseModel):
+        a_b: str
+
+        @computed_field  # type: ignore[prop-decorator]
+        @property
+        def c_d(self) -> str:
+            return "z"
+
+    assert Excluded._dump_fields is None
+    assert Computed._dump_fields is None
+    excluded = Excluded(a="x", secret="s")
+    computed = Computed(a_b="x")
+    assert BaseModel.to_dict(excluded) == excluded.model_dump(exclude_none=True, by_alias=True) == {"a": "x"}
+    assert BaseModel.to_dict(computed) == computed.model_dump(exclude_none=True, by_alias=True)
+    assert BaseModel.to_dict(computed) == {"aB": "x", "cD": "z"}
+
+    # Neither gets a generated to_dict, including subclasses of a flat model
+    class FlatComputed(UltraExecuteRequest):
+        @computed_field  # type: ignore[prop-decorator]
+        @property
+        def extra_key(self) -> str:
+            return "k"
+
+    class FlatExcluded(UltraExecuteRequest):
+        secret: Optional[str] = Field(default=None, exclude=True)
+
+    for model in (
+        excluded,
+        computed,
+        FlatComputed(signed_transaction="tx", request_id="id"),
+        FlatExcluded(signed_transaction="tx", request_id="id", secret="s"),
+    ):
+        assert not getattr(type(model).to_dict, "_generated", False)
+        assert model.to_dict() == model.model_dump(exclude_none=True, by_alias=True)
+
+    class Serialized(BaseModel):
+        amount: Annotated[int, PlainSerializer(str)]
+
+    serialized = Serialized(amount=5)
+    assert not getattr(Serialized.to_dict, "_generated", False)
+    assert serialized.to_dict() == serialized.model_dump(exclude_none=True, by_alias=True) == {"amount": "5"}
+
+
+def test_base_model_keeps_hand_written_to_dict():
+    """Subclasses of a model with its own to_dict are not given a generated one"""
+
+    class Custom(BaseModel):
+        name: str
+
+        def to_dict(self) -> dict[str, Any]:
+            return {"custom": self.name}
+
+    class Child(Custom):
+        extra: Optional[str] = None
+
+    assert getattr(UltraOrderRequest.to_dict, "_generated", False)
+    assert Child(name="n", extra="e").to_dict() == {"custom": "n"}
+
+
 @patch("curl_cffi.requests.Session.get")
-def test_sync_balances_mock(mock_get):
+def test_sync_balances_mock(mock_get, ultra_client):
     """Test sync balances method with mocked response"""
     load_environment()
-    client = UltraApiClient()
+    client = ultra_client
 
     # Mock response
     mock_response = Mock()
-    mock_response.json.return_value = {
-        "SOL": {
-            "amount": "100000000",
-            "uiAmount": 0.1,
-            "slot": 123456,
-            "isFrozen": False,
+    mock_response.content = json.dumps(
+        {
+            "SOL": {
+                "amount": "100000000",
+                "uiAmount": 0.1,
+                "slot": 123456,
+                "isFrozen": False,
+            }
         }
-    }
-    mock_response.raise_for_status = Mock()
+    ).encode()
+    mock_response.status_code = 200
     mock_get.return_value = mock_response
 
     # Test balances
@@ -116,26 +307,26 @@ def test_sync_balances_mock(mock_get):
     assert balances["SOL"]["amount"] == "100000000"
     assert balances["SOL"]["uiAmount"] == 0.1
 
-    client.close()
-
 
 @pytest.mark.asyncio
-async def test_async_balances_mock():
+async def test_async_balances_mock(async_ultra_client):
     """Test async balances method with mocked response"""
     load_environment()
-    client = AsyncUltraApiClient()
+    client = async_ultra_client
 
     # Mock the async get method
     mock_response = Mock()
-    mock_response.json.return_value = {
-        "SOL": {
-            "amount": "100000000",
-            "uiAmount": 0.1,
-            "slot": 123456,
-            "isFrozen": False,
+    mock_response.content = json.dumps(
+        {
+            "SOL": {
+                "amount": "100000000",
+                "uiAmount": 0.1,
+                "slot": 123456,
+                "isFrozen": False,
+            }
         }
-    }
-    mock_response.raise_for_status = Mock()
+    ).encode()
+    mock_response.status_code = 200
 
     with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
         mock_get.return_value = mock_response
@@ -148,4 +339,468 @@ async def test_async_balances_mock():
         assert balances["SOL"]["amount"] == "100000000"
         assert balances["SOL"]["uiAmount"] == 0.1
 
+
+@patch("curl_cffi.requests.Session.get")
+def test_sync_order_accepts_params_dict(mock_get, ultra_client):
+    """Test order sends a plain camelCase params dict as-is alongside the model form"""
+    client = ultra_client
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"requestId": "req-1", "transaction": "AQID"}).encode()
+    mock_get.return_value = mock_response
+
+    params: UltraOrderParams = {"inputMint": "a", "outputMint": "b", "amount": 1, "taker": "t"}
+    assert client.order(params)["requestId"] == "req-1"
+    assert mock_get.call_args.kwargs["params"] == params
+
+    client.order(UltraOrderRequest(input_mint="a", output_mint="b", amount=1, taker="t"))
+    assert mock_get.call_args.kwargs["params"] == params
+
+
+@patch("curl_cffi.requests.Session.post")
+def test_sync_execute_mock(mock_post, ultra_client):
+    """Test sync execute sends an orjson-encoded body with a JSON content type"""
+    client = ultra_client
+
+    mock_response = Mock()
+    mock_response.content = json.dumps({"status": "Success", "signature": "sig"}).encode()
+    mock_response.status_code = 200
+    mock_post.return_value = mock_response
+
+    result = client.execute(UltraExecuteRequest(signed_transaction="tx", request_id="id"))
+
+    assert result["status"] == "Success"
+    _, kwargs = mock_post.call_args
+    assert json.loads(kwargs["data"]) == {"signedTransaction": "tx", "requestId": "id"}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    params: UltraExecuteParams = {"signedTransaction": "tx2", "requestId": "id2"}
+    client.execute(params)
+    assert json.loads(mock_post.call_args.kwargs["data"]) == params
+
+
+@patch("curl_cffi.requests.Session.get")
+def test_sync_error_status_mapping(mock_get, ultra_client):
+    """Test HTTP error statuses map to the matching Jupiter exceptions"""
+    client = ultra_client
+
+    mock_response = Mock()
+    mock_response.headers = {"retry-after": "7"}
+    mock_get.return_value = mock_response
+
+    mock_response.status_code = 401
+    mock_response.content = b"not json"
+    with pytest.raises(JupiterAuthenticationError) as auth_info:
+        client.balances("abc")
+    assert auth_info.value.status_code == 401
+
+    mock_response.status_code = 429
+    with pytest.raises(JupiterRateLimitError) as rate_info:
+        client.balances("abc")
+    assert rate_info.value.retry_after == 7
+
+    mock_response.status_code = 500
+    mock_response.content = json.dumps({"message": "boom"}).encode()
+    with pytest.raises(JupiterAPIError) as api_info:
+        client.balances("abc")
+    assert api_info.value.status_code == 500
+    assert "boom" in str(api_info.value)
+
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"errorMessage": "Insufficient funds"}).encode()
+    with pytest.raises(JupiterAPIError, match="API Error: Insufficient funds"):
+        client.balances("abc")
+
+    mock_response.content = b"[]"
+    with pytest.raises(JupiterValidationError):
+        client.balances("abc")
+
+
+def test_exception_attributes():
+    """Test every exception sets the attributes of its whole hierarchy"""
+    rate = JupiterRateLimitError("slow down", retry_after=3, status_code=429)
+    assert isinstance(rate, JupiterAPIError)
+    assert (rate.message, rate.details, rate.status_code, rate.response_data) == ("slow down", {}, 429, {})
+    # Empty defaults are created on first access and then kept, so they can be filled in
+    rate.response_data["attempt"] = 1
+    assert rate.response_data == {"attempt": 1}
+    assert rate.retry_after == 3
+    assert str(rate) == "slow down"
+
+    auth = JupiterAuthenticationError("denied", 401, {"error": "x"})
+    assert (auth.message, auth.details, auth.status_code, auth.response_data) == ("denied", {}, 401, {"error": "x"})
+
+    api = JupiterAPIError("bad", details={"k": "v"})
+    assert (api.details, api.status_code, api.response_data) == ({"k": "v"}, None, {})
+
+    cause = OSError("reset")
+    network = JupiterNetworkError("down", cause)
+    assert (network.message, network.details, network.original_error) == ("down", {}, cause)
+
+    validation = JupiterValidationError("invalid", field="amount", value=-1)
+    assert isinstance(validation, JupiterError)
+    assert (validation.message, validation.details, validation.field, validation.value) == ("invalid", {}, "amount", -1)
+
+    kinds = [error.kind for error in (rate, auth, api, network, validation)]
+    assert kinds == ["rate_limit", "auth", "api", "network", "validation"]
+
+    # Slot attributes survive pickling
+    restored = pickle.loads(pickle.dumps(rate))
+    assert (restored.message, restored.status_code, restored.retry_after) == ("slow down", 429, 3)
+
+
+@patch("curl_cffi.requests.Session.get")
+def test_sync_shield_cache_mock(mock_get):
+    """Test sync shield serves cached mints without a new request"""
+    load_environment()
+    client = UltraApiClient(shield_cache_ttl=60)
+
+    wsol_mint = "So11111111111111111111111111111111111111112"
+    usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    warning = {"type": "LOW_LIQUIDITY", "message": "Low liquidity"}
+
+    mock_response = Mock()
+    mock_response.content = json.dumps({"warnings": {usdc_mint: [warning]}}).encode()
+    mock_response.status_code = 200
+    mock_get.return_value = mock_response
+
+    first = client.shield(mints=[wsol_mint, usdc_mint])
+    second = client.shield(mints=[wsol_mint, usdc_mint])
+
+    assert first == {"warnings": {usdc_mint: [warning]}}
+    assert second == first
+    assert mock_get.call_count == 1
+
+    # Editing returned results must not leak into later cached lookups
+    first["warnings"][usdc_mint].append({"type": "EDITED"})
+    second["warnings"][usdc_mint][0]["message"] = "edited"
+    third = client.shield(mints=[wsol_mint, usdc_mint])
+    assert third == {"warnings": {usdc_mint: [warning]}}
+    assert mock_get.call_count == 1
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_shield_cache_mock():
+    """Test async shield only requests mints missing from the cache"""
+    load_environment()
+    client = AsyncUltraApiClient(shield_cache_ttl=60)
+
+    wsol_mint = "So11111111111111111111111111111111111111112"
+    usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+    mock_response = Mock()
+    mock_response.content = json.dumps({"warnings": {}}).encode()
+    mock_response.status_code = 200
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        await client.shield(mints=[wsol_mint])
+        await client.shield(mints=[wsol_mint, usdc_mint])
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"] == {"mints": usdc_mint}
+
+    await client.close()
+
+
+def test_ttl_cache_expiry():
+    """Test TTLCache drops expired entries and evicts the oldest when full"""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+    with patch("pyjupiter.utils.cache.time.monotonic", return_value=time.monotonic() + 61):
+        assert cache.get("b", "expired") == "expired"
+    assert len(cache) == 1
+
+
+def test_endpoint_urls():
+    """Test endpoint URLs follow the configured base URL"""
+    client = UltraApiClient(api_key="test_key")
+
+    assert client._order_url == "https://api.jup.ag/ultra/v1/order"
+    assert client._execute_url == "https://api.jup.ag/ultra/v1/execute"
+    assert client._balances_url_prefix + "abc" == "https://api.jup.ag/ultra/v1/balances/abc"
+    assert client._shield_url == "https://api.jup.ag/ultra/v1/shield"
+
+    client.close()
+
+
+def test_headers_built_once():
+    """Test request headers are precomputed and shared read-only between calls"""
+    client = UltraApiClient(api_key="test-key")
+    headers = client._get_headers()
+    assert headers is client._get_headers()
+    assert dict(headers) == {"Accept": "application/json", "x-api-key": "test-key"}
+    with pytest.raises(TypeError):
+        headers["x-api-key"] = "other"  # type: ignore[index]
+
+    assert dict(UltraApiClient()._get_headers()) == {"Accept": "application/json"}
+
+    client.close()
+
+
+def test_prepare_shield_params_accepts_list_and_tuple():
+    """Test shield params are built the same for list and tuple mints"""
+    client = UltraApiClient()
+    mints = ["So11111111111111111111111111111111111111112", "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"]
+
+    expected = {"mints": ",".join(mints)}
+    assert client._prepare_shield_params(mints) == expected
+    assert client._prepare_shield_params(tuple(mints)) == expected
+
+    client.close()
+
+
+def test_prepare_execute_request_from_invalid_order():
+    """Test malformed order responses raise validation errors"""
+    client = UltraApiClient()
+
+    with pytest.raises(JupiterValidationError) as exc_info:
+        client._prepare_execute_request_from_order({"transaction": "AQID"})
+    assert exc_info.value.field == "requestId"
+
+    with pytest.raises(JupiterValidationError) as exc_info:
+        client._prepare_execute_request_from_order({"requestId": "abc", "transaction": ""})
+    assert exc_info.value.field == "transaction"
+
+    with pytest.raises(JupiterValidationError):
+        client._prepare_execute_request_from_order(None)  # type: ignore[arg-type]
+
+    client.close()
+
+
+def test_private_key_base58_decoding(monkeypatch):
+    """Test base58 private keys decode to the right keypair and bad input is rejected"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_PRIVATE_KEY", str(keypair))
+    client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+    assert client.get_public_key() == str(keypair.pubkey())
+
+    # The key is cached after the first load, so later environment changes are not picked up
+    monkeypatch.setenv("TEST_PRIVATE_KEY", "not-base58-0OIl")
+    assert client._get_keypair() is client._get_keypair()
+    assert client.get_public_key() == str(keypair.pubkey())
+    client.close()
+
+    client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+    with pytest.raises(JupiterValidationError) as exc_info:
+        client._load_private_key_bytes()
+    assert exc_info.value.field == "TEST_PRIVATE_KEY"
+
+    client.close()
+
+
+def test_private_key_uint8_array_decoding(monkeypatch):
+    """Test uint8 array private keys decode and invalid arrays are reported"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_PRIVATE_KEY", json.dumps(list(bytes(keypair))))
+    client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+    assert client.get_public_key() == str(keypair.pubkey())
+    client.close()
+
+    for raw, expected in [("[1, 256, -1, 2]", [256, -1]), ('[1, "a", 2.5]', ["a", 2.5]), ("[1, 2", None)]:
+        monkeypatch.setenv("TEST_PRIVATE_KEY", raw)
+        client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+        with pytest.raises(JupiterValidationError) as exc_info:
+            client._load_private_key_bytes()
+        assert exc_info.value.field == "TEST_PRIVATE_KEY"
+        if expected is not None:
+            assert exc_info.value.value == expected
+        else:
+            assert "Invalid JSON format" in str(exc_info.value)
+        client.close()
+
+
+def test_sign_versioned_transaction(monkeypatch):
+    """Test the wallet signature lands in its signer slot and verifies"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_PRIVATE_KEY", str(keypair))
+    client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(20)]
+    message = MessageV0.try_compile(
+        keypair.pubkey(), [Instruction(Pubkey.new_unique(), b"", accounts)], [], Hash.default()
+    )
+    unsigned = VersionedTransaction(message, [NullSigner(keypair.pubkey())])
+
+    signed = client._sign_versioned_transaction(unsigned)
+    assert signed.signatures[0].verify(keypair.pubkey(), to_bytes_versioned(message))
+    client.close()
+
+    # A keypair resolved by the caller is used as-is, without loading the key again
+    monkeypatch.delenv("TEST_PRIVATE_KEY")
+    client = UltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+    signed = client._sign_versioned_transaction(unsigned, keypair)
+    assert signed.signatures[0].verify(keypair.pubkey(), to_bytes_versioned(message))
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_public_key_is_cached(monkeypatch):
+    """Test async public key accessors return the same cached string"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_PRIVATE_KEY", str(keypair))
+    client = AsyncUltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+
+    public_key = await client.get_public_key()
+    assert public_key == str(keypair.pubkey())
+    assert await client.get_public_key_async() is public_key
+
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_order_and_execute_mock(monkeypatch):
+    """Test async order_and_execute signs the ordered transaction and submits it"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_PRIVATE_KEY", str(keypair))
+    client = AsyncUltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+
+    message = MessageV0.try_compile(keypair.pubkey(), [], [], Hash.default())
+    unsigned = VersionedTransaction(message, [NullSigner(keypair.pubkey())])
+    order_response = Mock()
+    order_response.status_code = 200
+    order_response.content = json.dumps(
+        {"requestId": "req-1", "transaction": base64.b64encode(bytes(unsigned)).decode()}
+    ).encode()
+    execute_response = Mock()
+    execute_response.status_code = 200
+    execute_response.content = json.dumps({"status": "Success"}).encode()
+
+    request = UltraOrderRequest(input_mint="a", output_mint="b", amount=1, taker=str(keypair.pubkey()))
+    get_patch = patch.object(client.client, "get", new_callable=AsyncMock, return_value=order_response)
+    post_patch = patch.object(client.client, "post", new_callable=AsyncMock, return_value=execute_response)
+    with get_patch, post_patch as mock_post:
+        result = await client.order_and_execute(request)
+
+    assert result == {"status": "Success"}
+    payload = json.loads(mock_post.call_args.kwargs["data"])
+    assert payload["requestId"] == "req-1"
+    signed = VersionedTransaction.from_bytes(base64.b64decode(payload["signedTransaction"]))
+    assert signed.signatures[0].verify(keypair.pubkey(), to_bytes_versioned(message))
+
+    # Once the key is cached the order is awaited directly, without extra tasks
+    get_patch = patch.object(client.client, "get", new_callable=AsyncMock, return_value=order_response)
+    post_patch = patch.object(client.client, "post", new_callable=AsyncMock, return_value=execute_response)
+    future_patch = patch("asyncio.ensure_future", side_effect=AssertionError("task scheduled"))
+    with get_patch, post_patch, future_patch:
+        assert await client.order_and_execute(request) == {"status": "Success"}
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_order_and_execute_without_key_cancels_order(monkeypatch):
+    """Test a missing private key fails order_and_execute and cancels the pending order"""
+    monkeypatch.delenv("TEST_PRIVATE_KEY", raising=False)
+    client = AsyncUltraApiClient(private_key_env_var="TEST_PRIVATE_KEY")
+    order_started = asyncio.Event()
+    order_cancelled = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        order_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            order_cancelled.set()
+            raise
+
+    with patch.object(client.client, "get", side_effect=slow_get):
+        with pytest.raises(JupiterValidationError):
+            await client.order_and_execute(UltraOrderRequest(input_mint="a", output_mint="b", amount=1))
+        await asyncio.sleep(0)
+
+    assert order_started.is_set()
+    assert order_cancelled.is_set()
+
+    await client.close()
+
+
+def test_sign_rejects_invalid_base64_transaction():
+    """Test non-alphabet characters in transaction data are rejected rather than skipped"""
+    client = UltraApiClient()
+
+    with pytest.raises(JupiterValidationError) as exc_info:
+        client._sign_base64_transaction("AQID!!!=")
+    assert exc_info.value.field == "transaction"
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_session_defaults():
+    """Test async client defaults to HTTP/2 and lets client_kwargs override it"""
+    client = AsyncUltraApiClient()
+    assert client.client.http_version == CurlHttpVersion.V2_0
+    assert client.client.impersonate == "chrome120"
+    assert client.client.max_clients == 64
+
+    client_http1 = AsyncUltraApiClient(client_kwargs={"http_version": CurlHttpVersion.V1_1})
+    assert client_http1.client.http_version == CurlHttpVersion.V1_1
+
+    await client.close()
+    await client_http1.close()
+
+
+def test_sync_client_session_defaults():
+    """Test sync client defaults to HTTP/2 and lets client_kwargs override it"""
+    client = UltraApiClient()
+    assert client.client.http_version == CurlHttpVersion.V2_0
+    assert client.client.impersonate == "chrome120"
+
+    client_http1 = UltraApiClient(client_kwargs={"http_version": CurlHttpVersion.V1_1})
+    assert client_http1.client.http_version == CurlHttpVersion.V1_1
+
+    client.close()
+    client_http1.close()
+
+
+def test_sync_client_context_manager():
+    """Test sync client closes its session when used as a context manager"""
+    with patch("curl_cffi.requests.Session.close") as mock_close:
+        with UltraApiClient() as client:
+            assert isinstance(client, UltraApiClient)
+        mock_close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager():
+    """Test async client closes its session when used as an async context manager"""
+    client = AsyncUltraApiClient()
+    with patch.object(client.client, "close", new_callable=AsyncMock) as mock_close:
+        async with client as entered:
+            assert entered is client
+        mock_close.assert_awaited_once()
+
+
+def test_package_imports_clients_lazily():
+    """Test importing pyjupiter defers the heavy client and model imports"""
+    code = (
+        "import sys, pyjupiter; "
+        "assert 'pyjupiter.clients.ultra_api_client' not in sys.modules; "
+        "assert pyjupiter.UltraApiClient.__name__ == 'UltraApiClient'; "
+        "assert 'pyjupiter.clients.ultra_api_client' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_eventloop_run_returns_result():
+    """Test the event loop helper runs a coroutine with and without uvloop"""
+
+    async def answer() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert eventloop.run(answer()) == 42
+    assert eventloop.run(answer(), use_uvloop=False) == 42